@@ -10,40 +10,53 @@ This is a lightweight, non-Evennia simulation that demonstrates:
 Run:
   source .venv/bin/activate
   python scripts/tutorial_loop_sim.py
+  python scripts/tutorial_loop_sim.py --seeds 64 --workers 8   # seed sweep
 
 Notes:
 - This is intentionally simple: it uses the existing Evenflow affinity modules.
 - It does not attempt to load a YAML location definition (no loader in repo yet).
+- The pressure field is a NumPy array (numpy is listed in requirements-dev.txt).
 """
 
 from __future__ import annotations
 
-import random
+import argparse
+import bisect
+import itertools
 import time
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple, Dict
+from dataclasses import dataclass, field as dc_field
+from typing import FrozenSet, List, Optional, Tuple, Dict
+
+import numpy as np
+
+try:  # optional: JIT the per-tick grid kernels when numba is installed
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - numba is not a repo dependency
+    _njit = None
 
 # Ensure repo root is on sys.path when running as a script
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 from world.affinity.core import Location, AffinityEvent
-from world.affinity.events import log_event
+from world.affinity.events import log_event, log_events_batch
 from world.affinity.computation import compute_affinity, get_threshold_label
 from world.affinity.affordances import AffordanceContext, evaluate_affordances, admin_reset_cooldowns
-from world.affinity.config import load_config_from_yaml, set_config, reset_config
+from world.affinity.config import AffinityConfig, load_config_from_yaml, set_config, reset_config
 
 
 # ----------------------------
 # Model
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class MadeGuy:
     actor_id: str
-    actor_tags: Set[str]
+    actor_tags: FrozenSet[str]
     # 5G-ish stats (0-10)
     grime: int
     game: int
@@ -52,7 +65,7 @@ class MadeGuy:
     guile: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Clocks:
     progress: int = 0
     heat: int = 0
@@ -61,82 +74,137 @@ class Clocks:
     trauma: int = 0
 
 
-@dataclass
+# ----------------------------
+# Grid kernels (plain arrays / ints)
+# ----------------------------
+
+def _jit(fn):
+    """Compile fn with numba if available, otherwise return it unchanged."""
+    return _njit(cache=True)(fn) if _njit is not None else fn
+
+
+@_jit
+def _decay(field: np.ndarray, rate: float) -> None:
+    field *= rate
+
+
+@_jit
+def _greedy_step(ax: int, ay: int, cx: int, cy: int, size: int, toward: bool) -> Tuple[int, int]:
+    """One greedy Manhattan step toward (or away from) (cx, cy), staying in bounds.
+
+    Closed form of the 4-neighbour search: the x axis is tried before y,
+    and any single step along an axis changes the distance by exactly 1.
+    """
+    if toward:
+        if ax != cx:
+            return ax + (1 if cx > ax else -1), ay
+        if ay != cy:
+            return ax, ay + (1 if cy > ay else -1)
+        return ax, ay
+    # On the core's own row/column either direction moves away; the old scan
+    # tried +1 first and fell back to -1, which matters when the core sits on
+    # a grid edge.
+    if ax > cx or (ax == cx and ax + 1 < size):
+        nx = ax + 1
+    else:
+        nx = ax - 1
+    if 0 <= nx < size:
+        return nx, ay
+    if ay > cy or (ay == cy and ay + 1 < size):
+        ny = ay + 1
+    else:
+        ny = ay - 1
+    if 0 <= ny < size:
+        return ax, ny
+    return ax, ay
+
+
+# Boolean disk stamps keyed by radius; built on first use.
+_DISK_MASKS: Dict[int, np.ndarray] = {}
+
+
+def _disk_mask(radius: int) -> np.ndarray:
+    """Return a cached (2r+1, 2r+1) mask of cells with dx*dx + dy*dy <= r*r."""
+    mask = _DISK_MASKS.get(radius)
+    if mask is None:
+        offsets = np.arange(-radius, radius + 1) ** 2
+        mask = np.add.outer(offsets, offsets) <= radius * radius
+        _DISK_MASKS[radius] = mask
+    return mask
+
+
+@dataclass(slots=True)
 class GridWorld:
     """21x21 physical grid centered on the Circle core."""
 
     size: int = 21
-    # scalar "pressure" per cell; higher => more hostile/warded-feeling
-    field: List[List[float]] = None
+    # scalar "pressure" per cell, flat row-major (index y*size + x);
+    # higher => more hostile/warded-feeling
+    field: np.ndarray = None
     # agent position (x,y), 0..size-1
     agent_x: int = 0
     agent_y: int = 0
     # core position (Claire/Circle)
     core_x: int = 0
     core_y: int = 0
+    # running total of field, kept in step with decay/stamps so summary() is O(1)
+    _sum: float = dc_field(default=0.0, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.field is None:
-            self.field = [[0.0 for _ in range(self.size)] for _ in range(self.size)]
+            self.field = np.zeros(self.size * self.size, dtype=np.float32)
+        self._sum = float(self.field.sum())
         self.core_x = self.size // 2
         self.core_y = self.size // 2
         # start agent near an edge
         self.agent_x = 1
         self.agent_y = self.size // 2
 
-    def in_bounds(self, x: int, y: int) -> bool:
-        return 0 <= x < self.size and 0 <= y < self.size
-
-    def dist_to_core(self) -> int:
-        return abs(self.agent_x - self.core_x) + abs(self.agent_y - self.core_y)
+    @property
+    def grid(self) -> np.ndarray:
+        """2D (size, size) view of the flat field; writes go through."""
+        return self.field.reshape(self.size, self.size)
 
     def decay(self, rate: float = 0.92) -> None:
-        for y in range(self.size):
-            row = self.field[y]
-            for x in range(self.size):
-                row[x] *= rate
+        _decay(self.field, rate)
+        self._sum *= rate
 
     def add_pressure_disk(self, cx: int, cy: int, radius: int, amount: float) -> None:
-        r2 = radius * radius
-        for y in range(cy - radius, cy + radius + 1):
-            for x in range(cx - radius, cx + radius + 1):
-                if not self.in_bounds(x, y):
-                    continue
-                dx = x - cx
-                dy = y - cy
-                if dx * dx + dy * dy <= r2:
-                    self.field[y][x] += amount
+        mask = _disk_mask(radius)
+        # Intersect the disk's bounding box with the grid, then trim the mask to match.
+        y0, y1 = max(cy - radius, 0), min(cy + radius + 1, self.size)
+        x0, x1 = max(cx - radius, 0), min(cx + radius + 1, self.size)
+        if y0 >= y1 or x0 >= x1:
+            return
+        my0, mx0 = y0 - (cy - radius), x0 - (cx - radius)
+        mask_view = mask[my0:my0 + (y1 - y0), mx0:mx0 + (x1 - x0)]
+        field_view = self.grid[y0:y1, x0:x1]
+        field_view[mask_view] += amount
+        self._sum += amount * int(mask_view.sum())
 
     def step_toward_core(self) -> None:
         """Move one step toward the core (greedy Manhattan)."""
-        best = (self.agent_x, self.agent_y)
-        best_d = self.dist_to_core()
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            nx, ny = self.agent_x + dx, self.agent_y + dy
-            if not self.in_bounds(nx, ny):
-                continue
-            d = abs(nx - self.core_x) + abs(ny - self.core_y)
-            if d < best_d:
-                best = (nx, ny)
-                best_d = d
-        self.agent_x, self.agent_y = best
+        self.agent_x, self.agent_y = _greedy_step(
+            self.agent_x, self.agent_y, self.core_x, self.core_y, self.size, True
+        )
 
     def step_away_from_core(self) -> None:
         """Move one step away from the core (greedy Manhattan)."""
-        best = (self.agent_x, self.agent_y)
-        best_d = self.dist_to_core()
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            nx, ny = self.agent_x + dx, self.agent_y + dy
-            if not self.in_bounds(nx, ny):
-                continue
-            d = abs(nx - self.core_x) + abs(ny - self.core_y)
-            if d > best_d:
-                best = (nx, ny)
-                best_d = d
-        self.agent_x, self.agent_y = best
+        self.agent_x, self.agent_y = _greedy_step(
+            self.agent_x, self.agent_y, self.core_x, self.core_y, self.size, False
+        )
 
     def cell_pressure(self, x: int, y: int) -> float:
-        return self.field[y][x]
+        return float(self.field[y * self.size + x])
+
+    def summary(self) -> float:
+        """Mean cell pressure, from the running total rather than a field scan."""
+        return self._sum / (self.size * self.size)
+
+
+# Render characters by pressure band: [<0.5, <1.5, <3.0, >=3.0]
+_PRESSURE_BINS = np.array([0.5, 1.5, 3.0])
+_PRESSURE_CHARS = np.array([".", ":", "*", "#"])
 
 
 def render_grid(world: GridWorld, last_complication: Optional[str] = None) -> str:
@@ -148,32 +216,64 @@ def render_grid(world: GridWorld, last_complication: Optional[str] = None) -> st
       ! = complication marker (on agent cell for this tick)
       . : * # = increasing pressure
     """
-    lines: List[str] = []
-    for y in range(world.size):
-        row_chars: List[str] = []
-        for x in range(world.size):
-            ch: str
-            if x == world.core_x and y == world.core_y:
-                ch = "C"
-            else:
-                p = world.cell_pressure(x, y)
-                if p < 0.5:
-                    ch = "."
-                elif p < 1.5:
-                    ch = ":"
-                elif p < 3.0:
-                    ch = "*"
-                else:
-                    ch = "#"
-
-            if x == world.agent_x and y == world.agent_y:
-                ch = "@"
-                if last_complication:
-                    ch = "!"
-
-            row_chars.append(ch)
-        lines.append("".join(row_chars))
-    return "\n".join(lines)
+    grid = _PRESSURE_CHARS[np.digitize(world.grid, _PRESSURE_BINS)]
+    grid[world.core_y, world.core_x] = "C"
+    grid[world.agent_y, world.agent_x] = "!" if last_complication else "@"
+    return "\n".join("".join(row) for row in grid)
+
+
+@lru_cache(maxsize=128)
+def threshold_label(affinity: float) -> str:
+    """Threshold label, memoized on the exact affinity value.
+
+    Keying on the float itself rather than a rounded bucket keeps every
+    label identical to get_threshold_label(), including values that sit
+    exactly on a band edge.
+    """
+    return get_threshold_label(affinity)
+
+
+# ----------------------------
+# Randomness
+# ----------------------------
+
+class BatchedRng:
+    """Seeded draws served from pre-sampled numpy.random.Generator batches.
+
+    Exposes the two calls the sim makes -- random() and randint(1, 10) --
+    but refills whole arrays with one Generator call instead of drawing
+    one value at a time through the Python object API.
+    """
+
+    __slots__ = ("_gen", "_batch", "_uniforms", "_u", "_d10", "_d")
+
+    def __init__(self, seed: int, batch: int = 256) -> None:
+        self._gen = np.random.default_rng(seed)
+        self._batch = batch
+        self._uniforms: List[float] = []
+        self._u = 0
+        self._d10: List[int] = []
+        self._d = 0
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)."""
+        if self._u >= len(self._uniforms):
+            self._uniforms = self._gen.random(self._batch).tolist()
+            self._u = 0
+        value = self._uniforms[self._u]
+        self._u += 1
+        return value
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Integer in [lo, hi]; d10 rolls come from their own batch."""
+        if (lo, hi) != (1, 10):
+            return int(self._gen.integers(lo, hi + 1))
+        if self._d >= len(self._d10):
+            self._d10 = self._gen.integers(1, 11, size=self._batch).tolist()
+            self._d = 0
+        value = self._d10[self._d]
+        self._d += 1
+        return value
 
 
 # ----------------------------
@@ -182,12 +282,26 @@ def render_grid(world: GridWorld, last_complication: Optional[str] = None) -> st
 
 ACTIONS = ["BLEND", "PROBE", "PRESS", "ABSORB", "PAYOFF", "CUT_OUT"]
 
+# Default action mix when no clock forces a choice: (population, cumulative weights)
+_DEFAULT_POP: Tuple[str, ...] = ("BLEND", "PROBE", "PRESS")
+_DEFAULT_CUM: Tuple[float, ...] = tuple(itertools.accumulate((0.40, 0.35, 0.25)))
+
 
-def clamp(x: int, lo: int, hi: int) -> int:
-    return max(lo, min(hi, x))
+def pick_default_action(rng: BatchedRng) -> str:
+    """Weighted pick from the default mix using one rng.random() draw.
+
+    Same draw and bisect as random.choices, without rebuilding the
+    cumulative weights on every call.
+    """
+    return _DEFAULT_POP[bisect.bisect_right(_DEFAULT_CUM, rng.random() * _DEFAULT_CUM[-1])]
 
 
-def roll(stat_total: int, rng: random.Random, dc: int = 10) -> bool:
+def clamp6(x: int) -> int:
+    """Clamp a clock value to its 0..6 range."""
+    return 0 if x < 0 else (6 if x > 6 else x)
+
+
+def roll(stat_total: int, rng: BatchedRng, dc: int = 10) -> bool:
     """Simple roll: stat_total + d10 >= dc+10.
 
     Keeps results somewhat noisy without being pure RNG.
@@ -200,31 +314,25 @@ def intensity_from(low: float, high: float, t: float) -> float:
     return low + (high - low) * t
 
 
-def log_basic_trespass(location: Location, actor: MadeGuy, now: float, intensity: float) -> None:
-    log_event(
-        location,
-        AffinityEvent(
-            event_type="trespass.enter",
-            actor_id=actor.actor_id,
-            actor_tags=set(actor.actor_tags),
-            location_id=location.location_id,
-            intensity=float(intensity),
-            timestamp=now,
-        ),
+def trespass_event(location: Location, actor: MadeGuy, now: float, intensity: float) -> AffinityEvent:
+    return AffinityEvent(
+        event_type="trespass.enter",
+        actor_id=actor.actor_id,
+        actor_tags=actor.actor_tags,
+        location_id=location.location_id,
+        intensity=float(intensity),
+        timestamp=now,
     )
 
 
-def log_threat(location: Location, actor: MadeGuy, now: float, intensity: float) -> None:
-    log_event(
-        location,
-        AffinityEvent(
-            event_type="social.threaten",
-            actor_id=actor.actor_id,
-            actor_tags=set(actor.actor_tags),
-            location_id=location.location_id,
-            intensity=float(intensity),
-            timestamp=now,
-        ),
+def threat_event(location: Location, actor: MadeGuy, now: float, intensity: float) -> AffinityEvent:
+    return AffinityEvent(
+        event_type="social.threaten",
+        actor_id=actor.actor_id,
+        actor_tags=actor.actor_tags,
+        location_id=location.location_id,
+        intensity=float(intensity),
+        timestamp=now,
     )
 
 
@@ -240,46 +348,48 @@ COMPLICATIONS = [
 ]
 
 
-def pick_complication(clocks: Clocks, threshold: str, rng: random.Random) -> Optional[str]:
+@lru_cache(maxsize=32)
+def _comp_table(e3: bool, e2: bool, h2: bool, hostile: bool) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Complication names and cumulative weights for one combination of clock/band flags."""
+    weights = (
+        1.0 + (1.0 if e3 else 0.0),  # WRONG_TURN
+        1.0 + (1.0 if e2 else 0.0),  # WATCHED
+        1.0 + (1.0 if h2 else 0.0),  # LOCAL_MUSCLE
+        0.5 + (1.0 if hostile else 0.0),  # WARD_RIPPLE
+    )
+    return tuple(COMPLICATIONS), tuple(itertools.accumulate(weights))
+
+
+def pick_complication(clocks: Clocks, threshold: str, rng: BatchedRng) -> Optional[str]:
     """Procedural complication based on exposure/heat + affinity band."""
+    hostile = threshold in ("hostile", "unwelcoming")
     base = 0.15
     base += 0.05 * clocks.exposure
     base += 0.03 * clocks.heat
-    if threshold in ("hostile", "unwelcoming"):
+    if hostile:
         base += 0.15
     if rng.random() > min(0.85, base):
         return None
     # Bias choice a bit
-    weights = {
-        "WRONG_TURN": 1.0 + (1.0 if clocks.exposure >= 3 else 0.0),
-        "WATCHED": 1.0 + (1.0 if clocks.exposure >= 2 else 0.0),
-        "LOCAL_MUSCLE": 1.0 + (1.0 if clocks.heat >= 2 else 0.0),
-        "WARD_RIPPLE": 0.5 + (1.0 if threshold in ("hostile", "unwelcoming") else 0.0),
-    }
-    pool: List[Tuple[str, float]] = list(weights.items())
-    total = sum(w for _, w in pool)
-    r = rng.random() * total
-    for k, w in pool:
-        r -= w
-        if r <= 0:
-            return k
-    return pool[-1][0]
+    names, cum = _comp_table(clocks.exposure >= 3, clocks.exposure >= 2, clocks.heat >= 2, hostile)
+    i = bisect.bisect_left(cum, rng.random() * cum[-1])
+    return names[min(i, len(names) - 1)]
 
 
 def apply_complication(comp: str, clocks: Clocks) -> str:
     """Apply complication effects; return a short label."""
     if comp == "WRONG_TURN":
         clocks.tick += 1  # costs time
-        clocks.exposure = clamp(clocks.exposure + 1, 0, 6)
+        clocks.exposure = clamp6(clocks.exposure + 1)
         return "Wrong turn: +1 TIME, +1 EXPOSURE"
     if comp == "WATCHED":
-        clocks.exposure = clamp(clocks.exposure + 1, 0, 6)
+        clocks.exposure = clamp6(clocks.exposure + 1)
         return "Watched: +1 EXPOSURE"
     if comp == "LOCAL_MUSCLE":
-        clocks.heat = clamp(clocks.heat + 1, 0, 6)
+        clocks.heat = clamp6(clocks.heat + 1)
         return "Local muscle: +1 HEAT"
     if comp == "WARD_RIPPLE":
-        clocks.exposure = clamp(clocks.exposure + 2, 0, 6)
+        clocks.exposure = clamp6(clocks.exposure + 2)
         return "Ward ripple: +2 EXPOSURE"
     return "(unknown complication)"
 
@@ -311,21 +421,37 @@ def build_circle_location() -> Location:
     )
 
 
-def print_state(clocks: Clocks) -> None:
-    print(
+def format_state(clocks: Clocks) -> str:
+    return (
         f"STATE  progress={clocks.progress}/6  time={clocks.tick}/10  heat={clocks.heat}/6  exposure={clocks.exposure}/6  trauma={clocks.trauma}"
     )
 
 
-def simulate(seed: int = 42) -> int:
-    rng = random.Random(seed)
 
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+_CONFIG: Optional[AffinityConfig] = None
+
+
+def _get_config() -> AffinityConfig:
+    """Load the affinity defaults once per process and reuse them across runs."""
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = load_config_from_yaml(str(project_root / "config" / "affinity_defaults.yaml"))
+    return _CONFIG
+
+
+def simulate(seed: int = 42, quiet: bool = False) -> Dict[str, object]:
+    """Run one tutorial loop and return a summary of how it ended.
+
+    With quiet=True nothing is printed and the grid is never rendered,
+    which is what seed sweeps use.
+    """
+    rng = BatchedRng(seed)
+
+    set_config(_get_config())
 
     actor = MadeGuy(
         actor_id="switch",
-        actor_tags={"human", "outsider", "crew"},
+        actor_tags=frozenset({"human", "outsider", "crew"}),
         grime=4,
         game=4,
         grift=7,
@@ -339,46 +465,57 @@ def simulate(seed: int = 42) -> int:
     clocks = Clocks()
     world = GridWorld(size=21)
 
-    print("=" * 72)
-    print("TUTORIAL LOOP SIM — 1 made guy / clocks / Evenflow")
-    print(f"seed={seed}")
-    print("=" * 72)
-
-    # Start by entering the zone
-    now = time.time()
-    log_basic_trespass(location, actor, now, intensity=0.25)
+    if not quiet:
+        print("=" * 72)
+        print("TUTORIAL LOOP SIM — 1 made guy / clocks / Evenflow")
+        print(f"seed={seed}")
+        print("=" * 72)
+
+    # Start by entering the zone. Wall time is read once here; ticks advance it
+    # with the monotonic clock. Timestamps stay epoch-seconds floats because
+    # trace decay in log_event measures elapsed time against time.time().
+    start_wall = time.time()
+    start_ns = time.monotonic_ns()
+    now = start_wall
+    log_event(location, trespass_event(location, actor, now, intensity=0.25))
     # seed pressure around the core (the Circle is "awake" even at baseline)
     world.add_pressure_disk(world.core_x, world.core_y, radius=5, amount=0.15)
 
+    # Movement affordance context; only the timestamp changes between ticks
+    ctx = AffordanceContext(
+        actor_id=actor.actor_id,
+        actor_tags=actor.actor_tags,
+        location=location,
+        action_type="move.pass",
+        action_target=None,
+        timestamp=now,
+    )
+
     while True:
         # Win/lose checks
+        ending: Optional[str] = None
         if clocks.progress >= 6:
-            print("\nWIN: Progress complete — Claire arrives / meeting achieved.")
-            break
-        if clocks.tick >= 10:
-            print("\nLOSE: Out of time — operation collapses.")
-            break
-        if clocks.heat >= 6:
-            print("\nLOSE: Heat maxed — blown.")
-            break
-        if clocks.exposure >= 6:
-            print("\nLOSE: Exposure maxed — the Circle fully has you.")
+            ending = "WIN: Progress complete — Claire arrives / meeting achieved."
+        elif clocks.tick >= 10:
+            ending = "LOSE: Out of time — operation collapses."
+        elif clocks.heat >= 6:
+            ending = "LOSE: Heat maxed — blown."
+        elif clocks.exposure >= 6:
+            ending = "LOSE: Exposure maxed — the Circle fully has you."
+        if ending:
+            if not quiet:
+                print("\n" + ending)
             break
 
-        now = time.time()
+        now = start_wall + (time.monotonic_ns() - start_ns) * 1e-9
+        # Events raised this tick; flushed into location memory once at tick end
+        pending_events: List[AffinityEvent] = []
 
         # World pulse: compute affinity and apply movement affordance (pathing)
         affinity = compute_affinity(location, actor.actor_id, actor.actor_tags, now=now)
-        threshold = get_threshold_label(affinity)
-
-        ctx = AffordanceContext(
-            actor_id=actor.actor_id,
-            actor_tags=set(actor.actor_tags),
-            location=location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
+        threshold = threshold_label(affinity)
+
+        ctx.timestamp = now
 
         outcome = evaluate_affordances(ctx)
         tell = outcome.tells[0] if outcome.tells else None
@@ -392,20 +529,22 @@ def simulate(seed: int = 42) -> int:
         if comp:
             comp_text = apply_complication(comp, clocks)
 
-        print("\n--- TICK", clocks.tick + 1, "---")
-        print(f"Affinity={affinity:.3f} ({threshold})")
-        if tell:
-            print("WORLD:", tell)
-        if "room.travel_time_modifier" in outcome.adjustments:
-            print(
-                "MOD: travel_time_modifier=",
-                f"{outcome.adjustments['room.travel_time_modifier']:+.3f}",
-            )
-        if comp_text:
-            print("COMPLICATION:", comp_text)
-
-        # Render grid snapshot
-        print(render_grid(world, last_complication=comp))
+        # Tick output is collected here and written once at tick end
+        buf: List[str] = []
+        if not quiet:
+            buf.append(f"\n--- TICK {clocks.tick + 1} ---\n")
+            buf.append(f"Affinity={affinity:.3f} ({threshold})\n")
+            if tell:
+                buf.append(f"WORLD: {tell}\n")
+            if "room.travel_time_modifier" in outcome.adjustments:
+                buf.append(
+                    f"MOD: travel_time_modifier= {outcome.adjustments['room.travel_time_modifier']:+.3f}\n"
+                )
+            if comp_text:
+                buf.append(f"COMPLICATION: {comp_text}\n")
+
+            # Render grid snapshot
+            buf.append(render_grid(world, last_complication=comp) + "\n")
 
         # Decide action (simple policy): prefer PROBE early, BLEND if heat, CUT_OUT if exposure, else PRESS sometimes
         if clocks.tick <= 1:
@@ -417,11 +556,7 @@ def simulate(seed: int = 42) -> int:
         elif clocks.exposure >= 4:
             action = "CUT_OUT"
         else:
-            action = rng.choices(
-                population=["BLEND", "PROBE", "PRESS"],
-                weights=[0.40, 0.35, 0.25],
-                k=1,
-            )[0]
+            action = pick_default_action(rng)
 
         # Movement each tick (physical grid): move toward core until progress is high,
         # then start drifting away (exfiltration).
@@ -433,31 +568,31 @@ def simulate(seed: int = 42) -> int:
         # Standing on "hot" cells increases exposure a bit
         cell_p = world.cell_pressure(world.agent_x, world.agent_y)
         if cell_p > 1.5:
-            clocks.exposure = clamp(clocks.exposure + 1, 0, 6)
+            clocks.exposure = clamp6(clocks.exposure + 1)
 
-        print("ACTION:", action)
+        if not quiet:
+            buf.append(f"ACTION: {action}\n")
 
         # Apply action effects
         if action == "BLEND":
             ok = roll(actor.grift + actor.game, rng, dc=9)
-            clocks.heat = clamp(clocks.heat - (1 if ok else 0), 0, 6)
-            clocks.progress = clamp(clocks.progress + (1 if ok and rng.random() < 0.4 else 0), 0, 6)
+            clocks.heat = clamp6(clocks.heat - (1 if ok else 0))
+            clocks.progress = clamp6(clocks.progress + (1 if ok and rng.random() < 0.4 else 0))
             clocks.tick += 1
-            log_basic_trespass(location, actor, now, intensity=0.15)
+            pending_events.append(trespass_event(location, actor, now, intensity=0.15))
             # blending cools the local cell a bit
             world.add_pressure_disk(world.agent_x, world.agent_y, radius=1, amount=-0.35)
 
         elif action == "PROBE":
             ok = roll(actor.guile, rng, dc=9)
-            clocks.progress = clamp(clocks.progress + (1 if ok else 0), 0, 6)
-            clocks.exposure = clamp(clocks.exposure + 1, 0, 6)
+            clocks.progress = clamp6(clocks.progress + (1 if ok else 0))
+            clocks.exposure = clamp6(clocks.exposure + 1)
             clocks.tick += 1
-            log_basic_trespass(location, actor, now, intensity=0.20)
+            pending_events.append(trespass_event(location, actor, now, intensity=0.20))
             # probing stirs the field (you light up wards)
             world.add_pressure_disk(world.agent_x, world.agent_y, radius=2, amount=0.25)
             # simulate "magic.observe" ping from Claire
-            log_event(
-                location,
+            pending_events.append(
                 AffinityEvent(
                     event_type="magic.observe",
                     actor_id="claire",
@@ -465,16 +600,16 @@ def simulate(seed: int = 42) -> int:
                     location_id=location.location_id,
                     intensity=0.7,
                     timestamp=now,
-                ),
+                )
             )
 
         elif action == "PRESS":
             ok = roll(actor.guns + actor.grime, rng, dc=11)
-            clocks.progress = clamp(clocks.progress + (2 if ok else 1), 0, 6)
-            clocks.heat = clamp(clocks.heat + 2, 0, 6)
-            clocks.exposure = clamp(clocks.exposure + 1, 0, 6)
+            clocks.progress = clamp6(clocks.progress + (2 if ok else 1))
+            clocks.heat = clamp6(clocks.heat + 2)
+            clocks.exposure = clamp6(clocks.exposure + 1)
             clocks.tick += 1
-            log_threat(location, actor, now, intensity=0.65)
+            pending_events.append(threat_event(location, actor, now, intensity=0.65))
             # pressing spikes local hostility
             world.add_pressure_disk(world.agent_x, world.agent_y, radius=3, amount=0.55)
 
@@ -484,27 +619,26 @@ def simulate(seed: int = 42) -> int:
 
         elif action == "PAYOFF":
             ok = roll(actor.game, rng, dc=10)
-            clocks.heat = clamp(clocks.heat - (2 if ok else 1), 0, 6)
-            clocks.exposure = clamp(clocks.exposure + 1, 0, 6)
+            clocks.heat = clamp6(clocks.heat - (2 if ok else 1))
+            clocks.exposure = clamp6(clocks.exposure + 1)
             clocks.tick += 1
-            log_event(
-                location,
+            pending_events.append(
                 AffinityEvent(
                     event_type="trade.exploit" if not ok else "trade.fair",
                     actor_id=actor.actor_id,
-                    actor_tags=set(actor.actor_tags),
+                    actor_tags=actor.actor_tags,
                     location_id=location.location_id,
                     intensity=0.3,
                     timestamp=now,
-                ),
+                )
             )
             # payoff calms heat locally but makes the place notice you
             world.add_pressure_disk(world.agent_x, world.agent_y, radius=1, amount=-0.15)
 
         elif action == "CUT_OUT":
             ok = roll(actor.grift, rng, dc=9)
-            clocks.exposure = clamp(clocks.exposure - (2 if ok else 1), 0, 6)
-            clocks.progress = clamp(clocks.progress - 1, 0, 6)
+            clocks.exposure = clamp6(clocks.exposure - (2 if ok else 1))
+            clocks.progress = clamp6(clocks.progress - 1)
             clocks.tick += 1
             # cutting out reduces pressure around you
             world.add_pressure_disk(world.agent_x, world.agent_y, radius=2, amount=-0.45)
@@ -512,11 +646,50 @@ def simulate(seed: int = 42) -> int:
         else:
             clocks.tick += 1
 
-        print_state(clocks)
+        if not quiet:
+            buf.append(format_state(clocks) + "\n")
+            sys.stdout.write("".join(buf))
+        log_events_batch(location, pending_events)
 
     reset_config()
+    return {
+        "seed": seed,
+        "won": ending.startswith("WIN"),
+        "ending": ending,
+        "ticks": clocks.tick,
+        "progress": clocks.progress,
+        "heat": clocks.heat,
+        "exposure": clocks.exposure,
+        "trauma": clocks.trauma,
+        "mean_pressure": world.summary(),
+    }
+
+
+def _run_one(seed: int) -> Dict[str, object]:
+    """Sweep worker: run one seed quietly."""
+    return simulate(seed, quiet=True)
+
+
+def sweep(seeds: int, workers: Optional[int] = None) -> int:
+    """Run simulate() for seeds 0..seeds-1 across a process pool."""
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(_run_one, range(seeds)))
+    wins = sum(1 for r in results if r["won"])
+    print(f"swept {len(results)} seeds: {wins} won, {len(results) - wins} lost")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=42, help="seed for a single run")
+    parser.add_argument("--seeds", type=int, default=None, help="sweep seeds 0..N-1 instead")
+    parser.add_argument("--workers", type=int, default=None, help="sweep processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    if args.seeds is not None:
+        return sweep(args.seeds, args.workers)
+    simulate(args.seed)
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(simulate())
+    raise SystemExit(main())
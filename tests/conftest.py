@@ -12,6 +12,28 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+# =============================================================================
+# SLOW TESTS
+# =============================================================================
+
+def pytest_addoption(parser):
+    """Add --runslow to opt in to long-running tests."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 # =============================================================================
 # VALIDATION ON TEST RUN
 # =============================================================================
@@ -23,6 +45,8 @@ def pytest_configure(config):
     This ensures bad YAML/configuration can't ship - validation errors
     surface as test collection failures.
     """
+    config.addinivalue_line("markers", "slow: long-running test, needs --runslow")
+
     from world.affinity.affordances import validate_affordance_definitions
     from world.affinity.validation import AffordanceValidationError
 
@@ -46,3 +70,27 @@ def validation_strict():
     from world.affinity.affordances import validate_affordance_definitions
     validate_affordance_definitions()
     return True
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """
+    Config loaded from config/affinity_defaults.yaml, parsed once per session.
+
+    Tests must not mutate it; load a fresh copy for tests that tweak values.
+    """
+    from world.affinity.config import load_config_from_yaml
+    return load_config_from_yaml("config/affinity_defaults.yaml")
+
+
+@pytest.fixture
+def active_default_config(default_config):
+    """
+    Activate the shared default config for one test, then restore.
+
+    Opt a module in with:
+        pytestmark = pytest.mark.usefixtures("active_default_config")
+    """
+    from world.affinity.config import use_config
+    with use_config(default_config):
+        yield default_config
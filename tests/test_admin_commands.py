@@ -4,10 +4,14 @@ Tests for admin debugging commands.
 See world/affinity/admin_commands.py for implementation.
 """
 
+import copy
+import dataclasses
 import time
 
+import pytest
+
 from world.affinity.core import Location, AffinityEvent, TraceRecord, AffordanceTriggerLog
-from world.affinity.config import load_config_from_yaml, set_config, reset_config
+from world.affinity.config import use_config
 from world.affinity.events import log_event
 from world.affinity.admin_commands import (
     cmd_affinity_inspect,
@@ -19,11 +23,32 @@ from world.affinity.admin_commands import (
 )
 
 
-def create_test_location_with_events():
-    """Create a location with some events."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+pytestmark = pytest.mark.usefixtures("active_default_config")
+
+
+HUMAN = frozenset({"human"})
+
+# Event templates; timestamps are filled in when the events are logged
+_EV1 = AffinityEvent(
+    event_type="harm.fire",
+    actor_id="actor_1",
+    actor_tags=HUMAN,
+    location_id="test_woods",
+    intensity=0.5,
+    timestamp=0.0,
+)
+_EV2 = AffinityEvent(
+    event_type="offer.gift",
+    actor_id="actor_1",
+    actor_tags=HUMAN,
+    location_id="test_woods",
+    intensity=0.3,
+    timestamp=0.0,
+)
+
 
+def create_test_location_with_events(config):
+    """Create a location with some events."""
     location = Location(
         location_id="test_woods",
         name="Test Woods",
@@ -34,39 +59,25 @@ def create_test_location_with_events():
     now = time.time()
 
     # Add some events
-    event1 = AffinityEvent(
-        event_type="harm.fire",
-        actor_id="actor_1",
-        actor_tags={"human"},
-        location_id="test_woods",
-        intensity=0.5,
-        timestamp=now,
-    )
-    log_event(location, event1)
+    with use_config(config):
+        log_event(location, dataclasses.replace(_EV1, timestamp=now))
+        log_event(location, dataclasses.replace(_EV2, timestamp=now))
 
-    event2 = AffinityEvent(
-        event_type="offer.gift",
-        actor_id="actor_1",
-        actor_tags={"human"},
-        location_id="test_woods",
-        intensity=0.3,
-        timestamp=now,
-    )
-    log_event(location, event2)
-
-    reset_config()
     return location
 
 
-def test_affinity_inspect_shows_top_traces():
+@pytest.fixture(scope="module")
+def seeded_location(default_config):
+    """Location with logged events, built once and shared by read-only tests."""
+    return create_test_location_with_events(default_config)
+
+
+def test_affinity_inspect_shows_top_traces(seeded_location):
     """Inspect command should show top contributing traces."""
-    location = create_test_location_with_events()
+    location = seeded_location
     now = time.time()
 
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
-    output = cmd_affinity_inspect(location, "actor_1", {"human"}, now)
+    output = cmd_affinity_inspect(location, "actor_1", HUMAN, now)
 
     # Should contain location info
     assert "Test Woods" in output
@@ -78,8 +89,6 @@ def test_affinity_inspect_shows_top_traces():
     # Should show traces
     assert "Top Contributing Traces:" in output
 
-    reset_config()
-
 
 def test_affinity_why_explains_trigger():
     """Why command should explain affordance trigger."""
@@ -87,7 +96,7 @@ def test_affinity_why_explains_trigger():
         location_id="test_woods",
         affordance_type="pathing",
         actor_id="actor_1",
-        actor_tags={"human"},
+        actor_tags=HUMAN,
         timestamp=time.time(),
         raw_affinity=-0.5,
         normalized_affinity=-0.48,
@@ -116,7 +125,7 @@ def test_affinity_replay_shows_snapshot_info():
         location_id="test_woods",
         affordance_type="pathing",
         actor_id="actor_1",
-        actor_tags={"human"},
+        actor_tags=HUMAN,
         timestamp=time.time(),
         raw_affinity=-0.5,
         normalized_affinity=-0.48,
@@ -133,12 +142,9 @@ def test_affinity_replay_shows_snapshot_info():
     assert "Snapshot available: Yes" in output
 
 
-def test_affinity_history_shows_personal_traces():
+def test_affinity_history_shows_personal_traces(seeded_location):
     """History command should show personal event history."""
-    location = create_test_location_with_events()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    location = seeded_location
 
     output = cmd_affinity_history(location, "actor_1", limit=10)
 
@@ -148,15 +154,10 @@ def test_affinity_history_shows_personal_traces():
     # Should show event types
     assert "harm.fire" in output or "offer.gift" in output
 
-    reset_config()
-
 
-def test_affinity_summary_shows_stats():
+def test_affinity_summary_shows_stats(seeded_location):
     """Summary command should show location statistics."""
-    location = create_test_location_with_events()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    location = seeded_location
 
     output = cmd_affinity_summary(location)
 
@@ -170,8 +171,6 @@ def test_affinity_summary_shows_stats():
     # Should show saturation
     assert "Saturation:" in output
 
-    reset_config()
-
 
 def test_get_top_contributing_traces():
     """Should return top traces by absolute value."""
@@ -200,10 +199,7 @@ def test_get_top_contributing_traces():
         event_count=1
     )
 
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
-    top_traces = get_top_contributing_traces(location, "actor_1", {"human"}, n=5, now=now)
+    top_traces = get_top_contributing_traces(location, "actor_1", HUMAN, n=5, now=now)
 
     # Should have traces
     assert len(top_traces) > 0
@@ -211,7 +207,30 @@ def test_get_top_contributing_traces():
     # First should be largest absolute value
     assert "harm" in top_traces[0][0]
 
-    reset_config()
+
+def test_get_top_contributing_traces_limits_to_n():
+    """Only the n strongest traces are returned, strongest first."""
+    location = Location(
+        location_id="test",
+        name="Test",
+        description="Test",
+    )
+
+    now = time.time()
+    for i, value in enumerate([0.1, -0.9, 0.4, -0.2, 0.7, 0.05]):
+        location.personal_traces[("actor_1", f"event_{i}")] = TraceRecord(
+            accumulated=value,
+            last_updated=now,
+            event_count=1
+        )
+
+    top_traces = get_top_contributing_traces(location, "actor_1", HUMAN, n=3, now=now)
+
+    assert [key for key, _ in top_traces] == [
+        "personal:actor_1:event_1",
+        "personal:actor_1:event_4",
+        "personal:actor_1:event_2",
+    ]
 
 
 def test_inspect_with_no_traces():
@@ -222,17 +241,12 @@ def test_inspect_with_no_traces():
         description="No traces",
     )
 
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
-    output = cmd_affinity_inspect(location, "actor_1", {"human"}, time.time())
+    output = cmd_affinity_inspect(location, "actor_1", HUMAN, time.time())
 
     # Should not crash
     assert "Empty Location" in output
     assert "no traces" in output.lower()
 
-    reset_config()
-
 
 def test_why_with_empty_traces():
     """Why command should handle empty trace list."""
@@ -240,7 +254,7 @@ def test_why_with_empty_traces():
         location_id="test",
         affordance_type="pathing",
         actor_id="actor_1",
-        actor_tags={"human"},
+        actor_tags=HUMAN,
         timestamp=time.time(),
         raw_affinity=0.0,
         normalized_affinity=0.0,
@@ -255,16 +269,17 @@ def test_why_with_empty_traces():
     assert "no trace data" in output.lower() or "Contributing Traces:" in output
 
 
-def test_summary_shows_scars():
+def test_summary_shows_scars(seeded_location):
     """Summary should show scar count."""
-    location = create_test_location_with_events()
+    # Appends a scar, so work on a copy of the shared location
+    location = copy.deepcopy(seeded_location)
 
     # Add a scar
     from world.affinity.core import ScarEvent
     location.scars.append(
         ScarEvent(
             event_type="harm",
-            actor_tags={"human"},
+            actor_tags=HUMAN,
             intensity=0.9,
             timestamp=time.time(),
             half_life_seconds=365 * 86400,
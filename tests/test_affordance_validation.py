@@ -11,7 +11,6 @@ See docs/DO_NOT.md for constraints.
 """
 
 import pytest
-import time
 
 from world.affinity.core import (
     Location,
@@ -34,7 +33,8 @@ from world.affinity.affordances import (
     get_handle_counts,
     admin_toggle_affordance,
     admin_force_mode,
-    admin_reset_cooldowns,
+    admin_get_force_modes,
+    admin_get_registry,
     AFFORDANCE_DEFAULTS,
     TELLS,
 )
@@ -51,16 +51,25 @@ from world.affinity.validation import (
     HandleNotAllowedError,
     TooManyHandlesError,
 )
-from world.affinity.config import reset_config
+from world.affinity.config import get_config, reset_config, use_config
 
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def test_location() -> Location:
-    """Create a test location with all affordances enabled."""
+# Fixed wall-clock time for contexts and events (2023-11-14 UTC).
+_NOW = 1_700_000_000.0
+
+# Shared by every test; tags are frozen so no test can alter them for the next.
+_ACTOR = {
+    "actor_id": "test_actor",
+    "actor_tags": frozenset({"human", "tester"}),
+}
+
+
+def _make_test_location() -> Location:
+    """Build a fresh location with all affordances enabled."""
     return Location(
         location_id="test_location",
         name="Test Location",
@@ -90,13 +99,133 @@ def test_location() -> Location:
     )
 
 
+@pytest.fixture
+def test_location() -> Location:
+    """Fresh test location with all affordances enabled, one per test."""
+    return _make_test_location()
+
+
+@pytest.fixture(autouse=True)
+def _default_config():
+    """Run every test against the default config."""
+    reset_config()
+    yield
+    reset_config()
+
+
+@pytest.fixture
+def now() -> float:
+    """Fixed evaluation time, so affordance RNG seeds repeat across runs."""
+    return _NOW
+
+
+@pytest.fixture
+def make_ctx(test_location, actor):
+    """
+    Factory for contexts of the test actor at the test location.
+
+    Call as make_ctx(action_type, timestamp, **extra_fields).
+    """
+    def _make_ctx(action_type: str, timestamp: float, **kwargs) -> AffordanceContext:
+        return AffordanceContext(
+            actor_id=actor["actor_id"],
+            actor_tags=actor["actor_tags"],
+            location=test_location,
+            action_type=action_type,
+            action_target=None,
+            timestamp=timestamp,
+            **kwargs,
+        )
+
+    return _make_ctx
+
+
+@pytest.fixture
+def force_pathing_hostile():
+    """Force pathing into hostile mode, undoing it even if the test fails."""
+    admin_force_mode("pathing", "hostile")
+    yield
+    admin_force_mode("pathing", None)
+
+
+@pytest.fixture(scope="session")
+def evaluate_cached():
+    """
+    Evaluate affordances once per distinct neutral context.
+
+    With no traces the outcome depends only on the action, the active
+    config and the global admin toggles/forced modes, so all of those
+    form the cache key and identical checks share one evaluation.
+    Returns a callable taking (action_type, spell_school, adjacent_rooms).
+    """
+    # key -> (config, outcome); holding the config keeps its id from being reused
+    cache = {}
+
+    def evaluate(action_type: str, spell_school=None, adjacent_rooms=()) -> AffordanceOutcome:
+        config = get_config()
+        key = (
+            action_type,
+            spell_school,
+            adjacent_rooms,
+            id(config),
+            tuple(sorted(admin_get_registry().items())),
+            tuple(sorted(admin_get_force_modes().items())),
+        )
+        hit = cache.get(key)
+        if hit is not None and hit[0] is config:
+            return hit[1]
+
+        ctx = AffordanceContext(
+            actor_id=_ACTOR["actor_id"],
+            actor_tags=_ACTOR["actor_tags"],
+            location=_make_test_location(),
+            action_type=action_type,
+            action_target=None,
+            timestamp=_NOW,
+            spell_school=spell_school,
+            adjacent_rooms=list(adjacent_rooms) or None,
+        )
+        with use_config(config):
+            outcome = evaluate_affordances(ctx)
+        cache[key] = (config, outcome)
+        return outcome
+
+    return evaluate
+
+
+@pytest.fixture(scope="class")
+def hostile_outcome() -> AffordanceOutcome:
+    """
+    One evaluation after a harm.fire event, shared per test class.
+
+    Uses its own location, separate from the per-test test_location.
+    Tests must only read the outcome and its snapshot.
+    """
+    reset_config()
+    location = _make_test_location()
+    log_event(location, AffinityEvent(
+        event_type="harm.fire",
+        actor_id=_ACTOR["actor_id"],
+        actor_tags=_ACTOR["actor_tags"],
+        location_id=location.location_id,
+        intensity=0.7,
+        timestamp=_NOW,
+    ))
+    ctx = AffordanceContext(
+        actor_id=_ACTOR["actor_id"],
+        actor_tags=_ACTOR["actor_tags"],
+        location=location,
+        action_type="move.pass",
+        action_target=None,
+        timestamp=_NOW,
+    )
+    return evaluate_affordances(ctx)
+
+
 @pytest.fixture
 def actor():
     """A test actor."""
-    return {
-        "actor_id": "test_actor",
-        "actor_tags": {"human", "tester"},
-    }
+    return _ACTOR
 
 
 # =============================================================================
@@ -238,44 +367,60 @@ class TestAdjustmentValidation:
 # PER-AFFORDANCE TESTS
 # =============================================================================
 
-class TestPathingAffordance:
-    """Tests for the pathing affordance."""
-
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no pathing effect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
+@pytest.mark.parametrize(
+    "action_type, extra_ctx, forbidden_handles",
+    [
+        pytest.param("move.pass", {}, ["room.travel_time_modifier"], id="pathing"),
+        pytest.param(
+            "move.pass", {},
+            ["room.encounter_rate_modifier", "npc.aggro_radius_modifier"],
+            id="encounter_bias",
+        ),
+        pytest.param(
+            "magic.cast", {"spell_school": "fire"}, ["spell.power_modifier"],
+            id="spell_side_effects",
+        ),
+        pytest.param(
+            "extract.harvest", {}, ["harvest.yield_modifier"],
+            id="resource_scarcity",
+        ),
+        pytest.param("heal.rest", {}, ["rest.healing_modifier"], id="rest_quality"),
+        pytest.param("extract.loot", {}, ["loot.quality_modifier"], id="loot_quality"),
+        pytest.param(
+            "move.pass", {"adjacent_rooms": ("room_a", "room_b")}, [],
+            id="misleading_navigation",
+        ),
+    ],
+)
+def test_neutral_is_noop(evaluate_cached, action_type, extra_ctx, forbidden_handles):
+    """Neutral affinity produces no mechanical effect and no redirect."""
+    outcome = evaluate_cached(action_type, **extra_ctx)
+
+    for handle in forbidden_handles:
+        assert handle not in outcome.adjustments
+    assert outcome.redirect_target is None
+
+
+def test_evaluate_cached_keys_on_admin_state(evaluate_cached):
+    """A forced mode must not be served the cached neutral outcome."""
+    neutral = evaluate_cached("move.pass")
+    admin_force_mode("pathing", "hostile")
+    try:
+        forced = evaluate_cached("move.pass")
+    finally:
+        admin_force_mode("pathing", None)
 
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
+    assert "room.travel_time_modifier" not in neutral.adjustments
+    assert "room.travel_time_modifier" in forced.adjustments
+    assert evaluate_cached("move.pass") is neutral
 
-        outcome = evaluate_affordances(ctx)
 
-        # Neutral = no pathing adjustment
-        assert "room.travel_time_modifier" not in outcome.adjustments
+class TestPathingAffordance:
+    """Tests for the pathing affordance."""
 
-    def test_hostile_touches_one_handle(self, test_location, actor):
+    def test_hostile_touches_one_handle(self, force_pathing_hostile, now, make_ctx):
         """Hostile pathing only modifies travel_time_modifier."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-        admin_force_mode("pathing", "hostile")
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
+        ctx = make_ctx("move.pass", now)
 
         outcome = evaluate_affordances(ctx)
 
@@ -284,23 +429,8 @@ class TestPathingAffordance:
                           if k == "room.travel_time_modifier"]
         assert len(pathing_handles) <= 1
 
-        admin_force_mode("pathing", None)
-
-    def test_tells_are_narrative(self, test_location, actor):
-        """Pathing tells contain no forbidden patterns."""
-        for tell in TELLS["pathing"]["hostile"]:
-            validate_tell(tell, "pathing", "hostile")  # Should not raise
-
-        for tell in TELLS["pathing"]["favorable"]:
-            validate_tell(tell, "pathing", "favorable")  # Should not raise
-
-    def test_replay_matches_exactly(self, test_location, actor):
+    def test_replay_matches_exactly(self, now, test_location, actor, make_ctx):
         """Replay returns exact stored values."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-
         # Create hostility
         event = AffinityEvent(
             event_type="harm.fire",
@@ -312,14 +442,7 @@ class TestPathingAffordance:
         )
         log_event(test_location, event)
 
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
+        ctx = make_ctx("move.pass", now)
 
         outcome = evaluate_affordances(ctx)
 
@@ -336,151 +459,53 @@ class TestPathingAffordance:
 class TestEncounterBiasAffordance:
     """Tests for the encounter bias affordance."""
 
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no encounter effect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
-
-        assert "room.encounter_rate_modifier" not in outcome.adjustments
-        assert "npc.aggro_radius_modifier" not in outcome.adjustments
-
     def test_touches_at_most_two_handles(self, test_location, actor):
         """Encounter bias modifies at most 2 handles."""
         config = AFFORDANCE_DEFAULTS["encounter_bias"]
-        handles = [config.get("handle"), config.get("handle_secondary")]
-        non_null = [h for h in handles if h]
-
-        assert len(non_null) <= 2
+        handle_count = sum(
+            1 for h in (config.get("handle"), config.get("handle_secondary")) if h
+        )
 
-    def test_tells_are_narrative(self):
-        """Encounter bias tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["encounter_bias"][group]:
-                validate_tell(tell, "encounter_bias", group)  # Should not raise
+        assert handle_count <= 2
 
 
 class TestSpellSideEffectsAffordance:
     """Tests for the spell side effects affordance."""
 
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no spell effect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="magic.cast",
-            action_target=None,
-            timestamp=now,
-            spell_school="fire",
-        )
-
-        outcome = evaluate_affordances(ctx)
-
-        assert "spell.power_modifier" not in outcome.adjustments
-
     def test_touches_at_most_two_handles(self):
         """Spell side effects modifies at most 2 handles."""
         config = AFFORDANCE_DEFAULTS["spell_side_effects"]
-        handles = [config.get("handle"), config.get("handle_secondary")]
-        non_null = [h for h in handles if h]
-
-        assert len(non_null) == 2  # Spell effects uses exactly 2
+        handle_count = sum(
+            1 for h in (config.get("handle"), config.get("handle_secondary")) if h
+        )
 
-    def test_tells_are_narrative(self):
-        """Spell side effects tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["spell_side_effects"][group]:
-                validate_tell(tell, "spell_side_effects", group)  # Should not raise
+        assert handle_count == 2  # Spell effects uses exactly 2
 
 
 class TestResourceScarcityAffordance:
     """Tests for the resource scarcity affordance."""
 
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no yield effect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="extract.harvest",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
-
-        assert "harvest.yield_modifier" not in outcome.adjustments
-
     def test_touches_one_handle(self):
         """Resource scarcity modifies only 1 handle."""
         config = AFFORDANCE_DEFAULTS["resource_scarcity"]
-        handles = [config.get("handle"), config.get("handle_secondary")]
-        non_null = [h for h in handles if h]
-
-        assert len(non_null) == 1
+        handle_count = sum(
+            1 for h in (config.get("handle"), config.get("handle_secondary")) if h
+        )
 
-    def test_tells_are_narrative(self):
-        """Resource scarcity tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["resource_scarcity"][group]:
-                validate_tell(tell, "resource_scarcity", group)  # Should not raise
+        assert handle_count == 1
 
 
 class TestRestQualityAffordance:
     """Tests for the rest quality affordance."""
 
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no rest effect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="heal.rest",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
-
-        assert "rest.healing_modifier" not in outcome.adjustments
-
     def test_touches_one_handle(self):
         """Rest quality modifies only 1 handle."""
         config = AFFORDANCE_DEFAULTS["rest_quality"]
-        handles = [config.get("handle"), config.get("handle_secondary")]
-        non_null = [h for h in handles if h]
-
-        assert len(non_null) == 1
+        handle_count = sum(
+            1 for h in (config.get("handle"), config.get("handle_secondary")) if h
+        )
 
-    def test_tells_are_narrative(self):
-        """Rest quality tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["rest_quality"][group]:
-                validate_tell(tell, "rest_quality", group)  # Should not raise
+        assert handle_count == 1
 
 
 class TestAmbientMessagingAffordance:
@@ -491,48 +516,18 @@ class TestAmbientMessagingAffordance:
         config = AFFORDANCE_DEFAULTS["ambient_messaging"]
         assert config.get("handle") is None
 
-    def test_tells_are_narrative(self):
-        """Ambient messaging tells contain no forbidden patterns."""
-        for group_name, tells in TELLS["ambient_messaging"].items():
-            for tell in tells:
-                validate_tell(tell, "ambient_messaging", group_name)  # Should not raise
-
 
 class TestLootQualityAffordance:
     """Tests for the loot quality affordance."""
 
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no loot effect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="extract.loot",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
-
-        assert "loot.quality_modifier" not in outcome.adjustments
-
     def test_touches_one_handle(self):
         """Loot quality modifies only 1 handle."""
         config = AFFORDANCE_DEFAULTS["loot_quality"]
-        handles = [config.get("handle"), config.get("handle_secondary")]
-        non_null = [h for h in handles if h]
-
-        assert len(non_null) == 1
+        handle_count = sum(
+            1 for h in (config.get("handle"), config.get("handle_secondary")) if h
+        )
 
-    def test_tells_are_narrative(self):
-        """Loot quality tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["loot_quality"][group]:
-                validate_tell(tell, "loot_quality", group)  # Should not raise
+        assert handle_count == 1
 
 
 class TestWeatherMicroclimateAffordance:
@@ -543,12 +538,6 @@ class TestWeatherMicroclimateAffordance:
         config = AFFORDANCE_DEFAULTS["weather_microclimate"]
         assert config.get("handle") is None
 
-    def test_tells_are_narrative(self):
-        """Weather microclimate tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["weather_microclimate"][group]:
-                validate_tell(tell, "weather_microclimate", group)  # Should not raise
-
 
 class TestAnimalMessengersAffordance:
     """Tests for the animal messengers affordance."""
@@ -558,50 +547,18 @@ class TestAnimalMessengersAffordance:
         config = AFFORDANCE_DEFAULTS["animal_messengers"]
         assert config.get("handle") is None
 
-    def test_tells_are_narrative(self):
-        """Animal messengers tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["animal_messengers"][group]:
-                validate_tell(tell, "animal_messengers", group)  # Should not raise
-
 
 class TestMisleadingNavigationAffordance:
     """Tests for the misleading navigation affordance."""
 
-    def test_neutral_is_noop(self, test_location, actor):
-        """Neutral affinity produces no redirect."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-            adjacent_rooms=["room_a", "room_b"],
-        )
-
-        outcome = evaluate_affordances(ctx)
-
-        # At neutral, should not redirect
-        assert outcome.redirect_target is None
-
     def test_touches_one_handle(self):
         """Misleading navigation modifies only 1 handle."""
         config = AFFORDANCE_DEFAULTS["misleading_navigation"]
-        handles = [config.get("handle"), config.get("handle_secondary")]
-        non_null = [h for h in handles if h]
-
-        assert len(non_null) == 1
+        handle_count = sum(
+            1 for h in (config.get("handle"), config.get("handle_secondary")) if h
+        )
 
-    def test_tells_are_narrative(self):
-        """Misleading navigation tells contain no forbidden patterns."""
-        for group in ["hostile", "favorable"]:
-            for tell in TELLS["misleading_navigation"][group]:
-                validate_tell(tell, "misleading_navigation", group)  # Should not raise
+        assert handle_count == 1
 
 
 # =============================================================================
@@ -611,67 +568,17 @@ class TestMisleadingNavigationAffordance:
 class TestReplayDeterminism:
     """Test that replay is 100% deterministic."""
 
-    def test_replay_affinity_returns_stored_value(self, test_location, actor):
+    def test_replay_affinity_returns_stored_value(self, hostile_outcome):
         """replay_from_snapshot returns stored value, not recomputed."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-
-        # Create trace
-        event = AffinityEvent(
-            event_type="harm.fire",
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location_id=test_location.location_id,
-            intensity=0.7,
-            timestamp=now,
-        )
-        log_event(test_location, event)
-
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
-        snapshot = outcome.snapshot
+        snapshot = hostile_outcome.snapshot
 
         # Replay should return EXACTLY the stored value
         replayed = replay_from_snapshot(snapshot)
         assert replayed == snapshot.computed_affinity
 
-    def test_replay_full_returns_all_stored_values(self, test_location, actor):
+    def test_replay_full_returns_all_stored_values(self, hostile_outcome):
         """replay_full_from_snapshot returns all stored values."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-
-        event = AffinityEvent(
-            event_type="harm.fire",
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location_id=test_location.location_id,
-            intensity=0.7,
-            timestamp=now,
-        )
-        log_event(test_location, event)
-
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
+        outcome = hostile_outcome
         result = replay_full_from_snapshot(outcome.snapshot)
 
         assert result.computed_affinity == outcome.snapshot.computed_affinity
@@ -680,91 +587,27 @@ class TestReplayDeterminism:
         assert result.tells == outcome.tells
         assert result.redirect_target == outcome.redirect_target
 
-    def test_verify_affinity_computation_matches(self, test_location, actor):
+    def test_verify_affinity_computation_matches(self, hostile_outcome):
         """Stored affinity matches recomputation from traces."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-
-        event = AffinityEvent(
-            event_type="harm.fire",
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location_id=test_location.location_id,
-            intensity=0.7,
-            timestamp=now,
-        )
-        log_event(test_location, event)
-
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
-
         # Verify stored affinity matches what we'd recompute
-        assert verify_affinity_computation(outcome.snapshot) is True
+        assert verify_affinity_computation(hostile_outcome.snapshot) is True
 
-    def test_replay_never_calls_rng(self, test_location, actor):
+    @pytest.mark.parametrize("repeats", [3, pytest.param(100, marks=pytest.mark.slow)])
+    def test_replay_never_calls_rng(self, force_pathing_hostile, now, make_ctx, repeats):
         """Replay functions return stored values, never use RNG."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-        admin_force_mode("pathing", "hostile")
-
-        now = time.time()
-
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
+        ctx = make_ctx("move.pass", now)
 
         outcome = evaluate_affordances(ctx)
 
-        # Call replay 100 times - should always return identical values
-        for _ in range(100):
+        # Replay repeatedly - should always return identical values
+        for _ in range(repeats):
             replayed = replay_full_from_snapshot(outcome.snapshot)
             assert replayed.tells == outcome.tells
             assert replayed.adjustments == outcome.adjustments
 
-        admin_force_mode("pathing", None)
-
-    def test_snapshot_stores_final_values(self, test_location, actor):
+    def test_snapshot_stores_final_values(self, hostile_outcome):
         """AffordanceSnapshot stores final_adjustments, final_tells, final_redirect_target."""
-        reset_config()
-        admin_reset_cooldowns(test_location)
-
-        now = time.time()
-
-        event = AffinityEvent(
-            event_type="harm.fire",
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location_id=test_location.location_id,
-            intensity=0.7,
-            timestamp=now,
-        )
-        log_event(test_location, event)
-
-        ctx = AffordanceContext(
-            actor_id=actor["actor_id"],
-            actor_tags=actor["actor_tags"],
-            location=test_location,
-            action_type="move.pass",
-            action_target=None,
-            timestamp=now,
-        )
-
-        outcome = evaluate_affordances(ctx)
+        outcome = hostile_outcome
         snapshot = outcome.snapshot
 
         # Snapshot should have final values matching outcome
@@ -804,6 +647,18 @@ class TestComprehensiveValidation:
         # Should not raise
         count = validate_all_tells(TELLS)
         assert count > 0
+        assert count == sum(
+            len(tells) for groups in TELLS.values() for tells in groups.values()
+        )
+
+    @pytest.mark.parametrize("aff_type", sorted(admin_get_registry()))
+    def test_every_affordance_has_tells(self, aff_type):
+        """Each registered affordance has non-empty tell groups to validate."""
+        assert aff_type in TELLS, f"{aff_type} is registered but has no tells"
+        groups = TELLS[aff_type]
+        assert groups
+        for group_name, tells in groups.items():
+            assert tells, f"{aff_type}.{group_name} has no tells"
 
     def test_handle_count_summary(self):
         """Print handle count summary for all affordances."""
@@ -6,8 +6,9 @@ See world/affinity/compaction.py for implementation.
 
 import time
 
+import pytest
+
 from world.affinity.core import Location, TraceRecord, ScarEvent
-from world.affinity.config import load_config_from_yaml, set_config, reset_config
 from world.affinity.compaction import (
     compact_traces,
     compact_personal_traces,
@@ -19,6 +20,9 @@ from world.affinity.compaction import (
 from world.affinity.world_tick import world_tick
 
 
+pytestmark = pytest.mark.usefixtures("active_default_config")
+
+
 def create_test_location():
     """Create a basic test location."""
     return Location(
@@ -31,27 +35,17 @@ def create_test_location():
 
 def test_fold_actor_tag_keeps_institutional():
     """Institutional tags should be kept during folding."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     # Test institutional tag (should be in config)
     assert fold_actor_tag("human") == "human"
     assert fold_actor_tag("elf") == "elf"
 
-    reset_config()
-
 
 def test_fold_actor_tag_discards_non_institutional():
     """Non-institutional tags should be discarded."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     # Test non-institutional tag
     assert fold_actor_tag("random_npc") is None
     assert fold_actor_tag("bandit_123") is None
 
-    reset_config()
-
 
 def test_fold_event_type_extracts_category():
     """Event type folding should extract category."""
@@ -62,9 +56,6 @@ def test_fold_event_type_extracts_category():
 
 def test_personal_traces_discarded_after_hot_window():
     """Personal traces older than 7 days should be discarded."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -89,14 +80,9 @@ def test_personal_traces_discarded_after_hot_window():
     assert ("actor_old", "harm.fire") not in location.personal_traces
     assert ("actor_recent", "offer.gift") in location.personal_traces
 
-    reset_config()
-
 
 def test_group_traces_merged_by_institutional_tag():
     """Group traces should merge by institutional tag + category."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -124,14 +110,9 @@ def test_group_traces_merged_by_institutional_tag():
     assert location.group_traces[("human", "harm")].accumulated == 1.5
     assert location.group_traces[("human", "harm")].event_count == 3
 
-    reset_config()
-
 
 def test_non_institutional_tags_discarded():
     """Non-institutional tags should be discarded during compaction."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -151,14 +132,9 @@ def test_non_institutional_tags_discarded():
     assert ("random_npc", "harm.fire") not in location.group_traces
     assert ("random_npc", "harm") not in location.group_traces
 
-    reset_config()
-
 
 def test_high_intensity_becomes_scar():
     """High-intensity events should become scars."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -181,14 +157,9 @@ def test_high_intensity_becomes_scar():
     assert "human" in scar.actor_tags
     assert scar.intensity == 2.0
 
-    reset_config()
-
 
 def test_low_intensity_does_not_become_scar():
     """Low-intensity events should not become scars."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -206,14 +177,9 @@ def test_low_intensity_does_not_become_scar():
     assert scars_created == 0
     assert len(location.scars) == 0
 
-    reset_config()
-
 
 def test_scars_have_long_half_life():
     """Scars should have 1-year half-life."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -231,14 +197,9 @@ def test_scars_have_long_half_life():
     # 365 days * 86400 seconds = 31536000
     assert scar.half_life_seconds == 365 * 86400
 
-    reset_config()
-
 
 def test_full_compaction_workflow():
     """Full compaction should process all tiers."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -289,14 +250,49 @@ def test_full_compaction_workflow():
     assert ("human", "harm") in location.group_traces  # Compacted
     assert len(location.scars) == 1  # Scar created
 
-    reset_config()
+
+def test_fused_compaction_matches_separate_passes(default_config):
+    """compact_traces must equal scarring then folding group traces."""
+    now = time.time()
+    seeded = {  # key -> (age in days, accumulated)
+        ("human", "harm.fire"): (10, 0.8),       # folded
+        ("human", "harm.poison"): (100, 1.5),    # scarred, then folded
+        ("elf", "harm.fire"): (100, 2.0),        # scarred, then folded
+        ("elf", "offer.gift"): (100, 0.1),       # folded, too weak to scar
+        ("bandit_123", "harm.fire"): (100, 3.0), # discarded, never scarred
+        ("human", "create.plant"): (1, 0.5),     # still hot
+    }
+
+    def build():
+        location = create_test_location()
+        for key, (age, accumulated) in seeded.items():
+            location.group_traces[key] = TraceRecord(
+                accumulated=accumulated,
+                last_updated=now - age * 86400,
+                event_count=1,
+            )
+        return location
+
+    hot = default_config.compaction.hot_window_days * 86400
+    warm = default_config.compaction.warm_window_days * 86400
+
+    separate = build()
+    scars = create_scars_from_warm(
+        separate, warm, default_config.compaction.scar_intensity_threshold, now
+    )
+    compacted = compact_group_traces(separate, hot, warm, now)
+
+    fused = build()
+    report = compact_traces(fused, now)
+
+    assert report.warm_to_scar == scars == 2
+    assert report.traces_compacted == compacted
+    assert fused.scars == separate.scars
+    assert fused.group_traces == separate.group_traces
 
 
 def test_compaction_integrated_with_world_tick():
     """World tick should run compaction."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
     location.last_tick = 0  # Very stale
@@ -315,14 +311,9 @@ def test_compaction_integrated_with_world_tick():
     assert report.compaction_warm_to_scar >= 0
     assert report.compaction_traces_compacted >= 0
 
-    reset_config()
-
 
 def test_compaction_preserves_hot_traces():
     """Compaction should preserve traces within hot window."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = create_test_location()
     now = time.time()
 
@@ -345,5 +336,3 @@ def test_compaction_preserves_hot_traces():
     assert report.traces_compacted == 0
     assert ("actor_1", "harm") in location.personal_traces
     assert ("human", "harm.fire") in location.group_traces  # Unchanged
-
-    reset_config()
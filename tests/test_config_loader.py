@@ -6,14 +6,20 @@ See world/affinity/config.py for implementation.
 
 import pytest
 import tempfile
+import threading
 from pathlib import Path
 
 from world.affinity.config import (
     load_config_from_yaml,
+    get_config,
+    use_config,
     AffinityConfig,
     HalfLives,
     ChannelWeights,
 )
+from world.affinity.computation import compute_affinity, get_location_params
+from world.affinity.core import AffinityEvent, Location
+from world.affinity.events import log_event
 
 
 def test_load_default_yaml():
@@ -99,3 +105,115 @@ def test_institutional_tags_loaded_as_set():
     assert isinstance(config.institutional_tags, set)
     assert "human" in config.institutional_tags
     assert "elf" in config.institutional_tags
+
+
+def test_repeat_loads_return_independent_configs():
+    """Cached parsing must still hand each caller its own config."""
+    first = load_config_from_yaml("config/affinity_defaults.yaml")
+    second = load_config_from_yaml("config/affinity_defaults.yaml")
+
+    assert first == second
+    assert first is not second
+
+    first.half_lives.location.personal = 99
+    first.institutional_tags.add("goblin")
+
+    assert second.half_lives.location.personal == 7
+    assert "goblin" not in second.institutional_tags
+    assert "goblin" not in load_config_from_yaml(
+        "config/affinity_defaults.yaml"
+    ).institutional_tags
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    """Changing the file on disk invalidates the cached parse."""
+    source = Path("config/affinity_defaults.yaml").read_text()
+    path = tmp_path / "affinity.yaml"
+    path.write_text(source)
+    assert load_config_from_yaml(str(path)).affinity_scale == 10.0
+
+    path.write_text(source.replace("affinity_scale: 10.0", "affinity_scale: 2.5"))
+    assert load_config_from_yaml(str(path)).affinity_scale == 2.5
+
+
+def test_location_params_follow_active_config():
+    """Unpacked location params should track config swaps."""
+    config = load_config_from_yaml("config/affinity_defaults.yaml")
+    config.half_lives.location.personal = 14
+    config.affinity_scale = 5.0
+
+    with use_config(config):
+        params = get_location_params()
+        assert params.personal_half_life == 14 * 86400
+        assert params.group_half_life == 30 * 86400
+        assert params.personal_weight == 0.5
+        assert params.tanh_scale == 0.5
+
+    params = get_location_params()
+    assert params.personal_half_life == 7 * 86400
+    assert params.tanh_scale == 1.0
+
+
+def test_in_place_config_edits_take_effect_once_reinstalled():
+    """Editing the active config, then re-activating it, changes later results."""
+    config = load_config_from_yaml("config/affinity_defaults.yaml")
+    location = Location(
+        location_id="test_woods",
+        name="Test Woods",
+        description="Test location",
+        valuation_profile={"harm.fire": -0.8},
+    )
+    now = 1_700_000_000.0
+
+    with use_config(config):
+        log_event(location, AffinityEvent(
+            event_type="harm.fire",
+            actor_id="alice",
+            actor_tags={"human"},
+            location_id="test_woods",
+            intensity=0.5,
+            timestamp=now,
+        ))
+        before = compute_affinity(location, "alice", {"human"}, now=now)
+
+        config.affinity_scale = 1.0
+        config.half_lives.location.personal = 14
+
+        with use_config(config):
+            params = get_location_params()
+            assert params.tanh_scale == 0.1
+            assert params.personal_half_life == 14 * 86400
+
+            after = compute_affinity(location, "alice", {"human"}, now=now)
+            assert after != before
+            assert abs(after) < abs(before)
+
+
+def test_use_config_restores_previous_config():
+    """use_config should nest and restore the outer config, even on error."""
+    outer = load_config_from_yaml("config/affinity_defaults.yaml")
+    inner = load_config_from_yaml("config/affinity_defaults.yaml")
+
+    with use_config(outer):
+        assert get_config() is outer
+        with pytest.raises(RuntimeError):
+            with use_config(inner):
+                assert get_config() is inner
+                raise RuntimeError("boom")
+        assert get_config() is outer
+
+    assert get_config() is not outer
+
+
+def test_use_config_is_scoped_to_the_current_thread():
+    """Other threads keep the process-wide config while a block is active."""
+    scoped = load_config_from_yaml("config/affinity_defaults.yaml")
+    seen = []
+
+    with use_config(scoped):
+        worker = threading.Thread(target=lambda: seen.append(get_config()))
+        worker.start()
+        worker.join()
+        assert get_config() is scoped
+
+    assert seen and seen[0] is not scoped
@@ -0,0 +1,84 @@
+"""
+Tests for event logging.
+
+Verifies that batched logging matches per-event logging.
+"""
+
+import time
+
+from world.affinity.core import Location, AffinityEvent
+from world.affinity.config import load_config_from_yaml, use_config
+from world.affinity.events import log_event, log_events_batch
+
+
+def _make_location() -> Location:
+    return Location(
+        location_id="test_woods",
+        name="Test Woods",
+        description="Test location",
+        valuation_profile={"harm.fire": -0.8, "offer.gift": 0.5},
+    )
+
+
+def _make_events(now: float):
+    return [
+        AffinityEvent(
+            event_type="harm.fire",
+            actor_id="alice",
+            actor_tags={"human", "outsider"},
+            location_id="test_woods",
+            intensity=0.5,
+            timestamp=now,
+        ),
+        AffinityEvent(
+            event_type="offer.gift",
+            actor_id="bob",
+            actor_tags={"elf"},
+            location_id="test_woods",
+            intensity=0.3,
+            timestamp=now,
+        ),
+        AffinityEvent(
+            event_type="harm.fire",
+            actor_id="alice",
+            actor_tags={"human"},
+            location_id="test_woods",
+            intensity=0.2,
+            timestamp=now,
+        ),
+    ]
+
+
+def test_log_events_batch_matches_log_event():
+    """Batch logging produces the same traces as logging one at a time."""
+    config = load_config_from_yaml("config/affinity_defaults.yaml")
+
+    now = time.time()
+    with use_config(config):
+        sequential = _make_location()
+        for event in _make_events(now):
+            log_event(sequential, event)
+
+        batched = _make_location()
+        count = log_events_batch(batched, _make_events(now))
+
+    assert count == 3
+    for channel in ("personal_traces", "group_traces", "behavior_traces"):
+        expected = getattr(sequential, channel)
+        actual = getattr(batched, channel)
+        assert expected.keys() == actual.keys()
+        for key, trace in expected.items():
+            assert actual[key].event_count == trace.event_count
+            assert abs(actual[key].accumulated - trace.accumulated) < 1e-6
+
+    assert batched.personal_traces[("alice", "harm.fire")].event_count == 2
+
+
+def test_log_events_batch_empty_is_noop():
+    """An empty batch leaves the location untouched."""
+    location = _make_location()
+
+    assert log_events_batch(location, []) == 0
+    assert location.personal_traces == {}
+    assert location.group_traces == {}
+    assert location.behavior_traces == {}
@@ -4,10 +4,10 @@ Tests for institution drift system.
 See world/affinity/institutions.py for implementation.
 """
 
-import time
+
+import pytest
 
 from world.affinity.core import Institution, Location, AffinityEvent, TraceRecord
-from world.affinity.config import load_config_from_yaml, set_config, reset_config
 from world.affinity.events import log_event
 from world.affinity.institutions import (
     update_institution,
@@ -18,6 +18,13 @@ from world.affinity.institutions import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("active_default_config")
+
+# Fixed clock: traces and queries share one timestamp, so results do not
+# depend on wall time or on how long the suite takes to reach a test
+_NOW = 1_700_000_000.0
+
+
 def create_test_institution():
     """Create a basic test institution."""
     return Institution(
@@ -28,11 +35,8 @@ def create_test_institution():
     )
 
 
-def create_test_location_with_affinity():
+def _build_location_with_affinity():
     """Create a location with some affinity."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = Location(
         location_id="forest",
         name="Forest",
@@ -40,7 +44,7 @@ def create_test_location_with_affinity():
         valuation_profile={"harm.fire": -0.8},
     )
 
-    now = time.time()
+    now = _NOW
 
     # Add some traces to create affinity
     event = AffinityEvent(
@@ -53,10 +57,15 @@ def create_test_location_with_affinity():
     )
     log_event(location, event)
 
-    reset_config()
     return location
 
 
+@pytest.fixture
+def location(active_default_config):
+    """Fresh location with affinity, logged under the default config."""
+    return _build_location_with_affinity()
+
+
 def test_institution_creation():
     """Institution should be created with default values."""
     institution = create_test_institution()
@@ -68,14 +77,10 @@ def test_institution_creation():
     assert institution.last_computed == 0.0
 
 
-def test_query_constituent_affinity():
+def test_query_constituent_affinity(location):
     """Should compute average affinity from constituents."""
     institution = create_test_institution()
-    location = create_test_location_with_affinity()
-    now = time.time()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    now = _NOW
 
     affinity = query_constituent_affinity(
         institution,
@@ -88,17 +93,11 @@ def test_query_constituent_affinity():
     assert affinity < 0
     assert -1.0 <= affinity <= 1.0
 
-    reset_config()
-
 
-def test_update_institution_drifts_slowly():
+def test_update_institution_drifts_slowly(location):
     """Institution should drift slowly toward constituent affinity."""
     institution = create_test_institution()
-    location = create_test_location_with_affinity()
-    now = time.time()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    now = _NOW
 
     # Set initial cached stance
     institution.cached_stance["human"] = 0.5  # Positive
@@ -114,17 +113,11 @@ def test_update_institution_drifts_slowly():
     # But not all the way (due to inertia)
     assert new_stance > -1.0
 
-    reset_config()
-
 
-def test_multiple_updates_converge():
+def test_multiple_updates_converge(location):
     """Multiple updates should slowly converge to constituent affinity."""
     institution = create_test_institution()
-    location = create_test_location_with_affinity()
-    now = time.time()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    now = _NOW
 
     # Set initial cached stance far from constituent
     institution.cached_stance["human"] = 0.9
@@ -142,10 +135,8 @@ def test_multiple_updates_converge():
         # Stance should be decreasing (moving toward negative)
         assert stances[i] >= stances[i + 1]
 
-    reset_config()
-
 
-def test_inertia_resists_rapid_change():
+def test_inertia_resists_rapid_change(location):
     """High inertia should resist rapid changes."""
     institution = Institution(
         institution_id="test",
@@ -155,11 +146,7 @@ def test_inertia_resists_rapid_change():
         inertia=0.9,  # High inertia
     )
 
-    location = create_test_location_with_affinity()
-    now = time.time()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    now = _NOW
 
     # Set cached stance
     initial_stance = 0.5
@@ -172,8 +159,6 @@ def test_inertia_resists_rapid_change():
     change = abs(institution.cached_stance["human"] - initial_stance)
     assert change < 0.2  # Less than 20% change in single update
 
-    reset_config()
-
 
 def test_query_institution_stance():
     """Should return cached stance for target."""
@@ -196,11 +181,8 @@ def test_query_unknown_stance_returns_zero():
 
 def test_should_refresh_institution():
     """Should refresh when enough time has passed."""
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     institution = create_test_institution()
-    now = time.time()
+    now = _NOW
 
     # Just computed
     institution.last_computed = now
@@ -210,8 +192,6 @@ def test_should_refresh_institution():
     one_day_later = now + 86400
     assert should_refresh_institution(institution, one_day_later) is True
 
-    reset_config()
-
 
 def test_institutional_memory_decay():
     """Institutional memory should decay slowly."""
@@ -240,13 +220,27 @@ def test_institutional_memory_decays_all_stances():
     assert 0.1 < institution.cached_stance["dwarf"] < 0.2
 
 
+def test_query_constituent_affinity_accepts_iterables(location):
+    """Any iterable of locations should average the same as a list."""
+    institution = create_test_institution()
+    now = _NOW
+
+    from_list = query_constituent_affinity(institution, [location], "human", now)
+    from_generator = query_constituent_affinity(
+        institution, (loc for loc in [location]), "human", now
+    )
+    empty_generator = query_constituent_affinity(
+        institution, (loc for loc in []), "human", now
+    )
+
+    assert from_generator == from_list
+    assert empty_generator == 0.0
+
+
 def test_institution_with_multiple_locations():
     """Should average affinity from multiple locations."""
     institution = create_test_institution()
-    now = time.time()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    now = _NOW
 
     # Create two locations with different affinities
     location1 = Location(
@@ -282,20 +276,12 @@ def test_institution_with_multiple_locations():
     # Should be somewhere between negative and positive
     assert -1.0 < avg_affinity < 1.0
 
-    reset_config()
 
-
-def test_update_institution_updates_last_computed():
+def test_update_institution_updates_last_computed(location):
     """Update should set last_computed timestamp."""
     institution = create_test_institution()
-    location = create_test_location_with_affinity()
-    now = time.time()
-
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    now = _NOW
 
     update_institution(institution, [location], {"human"}, now)
 
     assert institution.last_computed == now
-
-    reset_config()
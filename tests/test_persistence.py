@@ -5,7 +5,6 @@ See world/affinity/persistence.py for implementation.
 """
 
 import json
-import tempfile
 import time
 from pathlib import Path
 
@@ -216,94 +215,102 @@ def test_deserialize_location_id_mismatch_raises():
         assert "State mismatch" in str(e)
 
 
-def test_save_creates_directory():
+def test_save_creates_directory(tmp_path):
     """Save should create data directory if it doesn't exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        location = Location(
-            location_id="test",
-            name="Test",
-            description="Test",
-        )
+    location = Location(
+        location_id="test",
+        name="Test",
+        description="Test",
+    )
 
-        data_dir = f"{tmpdir}/nested/path"
-        save_location_state(location, data_dir=data_dir)
+    data_dir = str(tmp_path / "nested" / "path")
+    save_location_state(location, data_dir=data_dir)
 
-        assert Path(f"{data_dir}/test.json").exists()
+    assert Path(f"{data_dir}/test.json").exists()
 
 
-def test_save_load_round_trip():
+def test_save_load_round_trip(tmp_path):
     """Save and load should preserve location state."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        original = create_test_location_with_traces()
+    original = create_test_location_with_traces()
 
-        # Save
-        save_location_state(original, data_dir=tmpdir)
+    # Save
+    save_location_state(original, data_dir=str(tmp_path))
 
-        # Load into fresh location
-        fresh = Location(
-            location_id=original.location_id,
-            name=original.name,
-            description=original.description,
-            valuation_profile=original.valuation_profile,
-        )
+    # Load into fresh location
+    fresh = Location(
+        location_id=original.location_id,
+        name=original.name,
+        description=original.description,
+        valuation_profile=original.valuation_profile,
+    )
 
-        loaded = load_location_state(fresh, data_dir=tmpdir)
+    loaded = load_location_state(fresh, data_dir=str(tmp_path))
 
-        assert loaded is True
-        assert fresh.personal_traces == original.personal_traces
-        assert fresh.saturation.personal == original.saturation.personal
-        assert fresh.last_tick == original.last_tick
+    assert loaded is True
+    assert fresh.personal_traces == original.personal_traces
+    assert fresh.saturation.personal == original.saturation.personal
+    assert fresh.last_tick == original.last_tick
 
 
-def test_load_nonexistent_file():
+def test_load_nonexistent_file(tmp_path):
     """Loading nonexistent state should return False, not error."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        location = Location(
-            location_id="test",
-            name="Test",
-            description="Test",
-        )
+    location = Location(
+        location_id="test",
+        name="Test",
+        description="Test",
+    )
 
-        result = load_location_state(location, data_dir=tmpdir)
+    result = load_location_state(location, data_dir=str(tmp_path))
 
-        assert result is False
+    assert result is False
 
 
-def test_atomic_write():
+def test_atomic_write(tmp_path):
     """Save should use atomic write (temp file + rename)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        location = Location(
-            location_id="test",
-            name="Test",
-            description="Test",
-        )
+    location = Location(
+        location_id="test",
+        name="Test",
+        description="Test",
+    )
 
-        save_location_state(location, data_dir=tmpdir)
+    save_location_state(location, data_dir=str(tmp_path))
 
-        # Temp file should be cleaned up
-        temp_files = list(Path(tmpdir).glob("*.tmp"))
-        assert len(temp_files) == 0
+    # Temp file should be cleaned up
+    temp_files = list(tmp_path.glob("*.tmp"))
+    assert len(temp_files) == 0
 
-        # Final file should exist
-        final_file = Path(tmpdir) / "test.json"
-        assert final_file.exists()
+    # Final file should exist
+    final_file = tmp_path / "test.json"
+    assert final_file.exists()
 
 
-def test_saved_json_is_valid():
+def test_saved_json_is_valid(tmp_path):
     """Saved JSON should be valid and readable."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        location = create_test_location_with_traces()
+    location = create_test_location_with_traces()
+
+    save_location_state(location, data_dir=str(tmp_path))
+
+    # Read the JSON file directly
+    json_file = tmp_path / f"{location.location_id}.json"
+    data = json.loads(json_file.read_text())
+
+    assert data["location_id"] == location.location_id
+    assert "personal_traces" in data
+    assert "saturation" in data
+    assert "saved_at" in data
+
 
-        save_location_state(location, data_dir=tmpdir)
+def test_changed_save_rewrites(tmp_path):
+    """Saving after a state change should replace the file."""
+    location = create_test_location_with_traces()
+    json_file = tmp_path / f"{location.location_id}.json"
 
-        # Read the JSON file directly
-        json_file = Path(tmpdir) / f"{location.location_id}.json"
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+    save_location_state(location, data_dir=str(tmp_path))
+    location.saturation.group = 0.9
+    save_location_state(location, data_dir=str(tmp_path))
 
-        assert data["location_id"] == location.location_id
-        assert "personal_traces" in data
-        assert "saturation" in data
+    data = json.loads(json_file.read_text())
+    assert data["saturation"]["group"] == 0.9
 
 
 def test_empty_location_serialization():
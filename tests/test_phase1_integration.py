@@ -4,18 +4,22 @@ Phase 1 integration tests.
 Tests the full lifecycle: config → events → tick → save → load
 """
 
-import tempfile
 import time
 
+import pytest
+
 from world.affinity.core import Location, AffinityEvent
-from world.affinity.config import load_config_from_yaml, set_config, reset_config
+from world.affinity.config import get_config
 from world.affinity.events import log_event
 from world.affinity.computation import compute_affinity
 from world.affinity.world_tick import world_tick
 from world.affinity.persistence import save_location_state, load_location_state
 
 
-def test_phase1_full_lifecycle():
+pytestmark = pytest.mark.usefixtures("active_default_config")
+
+
+def test_phase1_full_lifecycle(tmp_path, default_config):
     """
     Full lifecycle: config → events → tick → save → load.
 
@@ -26,9 +30,8 @@ def test_phase1_full_lifecycle():
     4. Persistence saves and loads state correctly
     5. Affinity values are preserved through save/load
     """
-    # Step 1: Load config from YAML
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
+    # Step 1: Config loaded from YAML is active (via active_default_config)
+    assert get_config() is default_config
 
     # Step 2: Create location
     location = Location(
@@ -78,52 +81,44 @@ def test_phase1_full_lifecycle():
     assert report.traces_pruned > 0, "Tick should have pruned old traces"
 
     # Step 6: Save state to temp directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        save_location_state(location, data_dir=tmpdir)
-
-        # Step 7: Load into fresh location
-        location2 = Location(
-            location_id="test_woods",
-            name="Test Woods",
-            description="Test location",
-            valuation_profile={"harm.fire": -0.8, "offer.gift": 0.5},
-        )
-
-        loaded = load_location_state(location2, data_dir=tmpdir)
-        assert loaded is True, "State should be loaded successfully"
-
-        # Step 8: Verify state preserved
-        assert location2.last_tick == location.last_tick, "last_tick should match"
-        assert len(location2.personal_traces) == len(location.personal_traces), \
-            "Personal traces count should match"
-
-        # Step 9: Compute affinity after load
-        affinity_after = compute_affinity(
-            location2,
-            actor_id="actor_recent",
-            actor_tags={"human"},
-            now=now
-        )
-
-        # Affinity should be approximately the same
-        # (small differences due to floating point, but should be very close)
-        assert abs(affinity_after - affinity_before) < 0.001, \
-            f"Affinity should be preserved (before: {affinity_before}, after: {affinity_after})"
-
-    # Cleanup
-    reset_config()
-
-
-def test_config_affects_tick_behavior():
+    save_location_state(location, data_dir=str(tmp_path))
+
+    # Step 7: Load into fresh location
+    location2 = Location(
+        location_id="test_woods",
+        name="Test Woods",
+        description="Test location",
+        valuation_profile={"harm.fire": -0.8, "offer.gift": 0.5},
+    )
+
+    loaded = load_location_state(location2, data_dir=str(tmp_path))
+    assert loaded is True, "State should be loaded successfully"
+
+    # Step 8: Verify state preserved
+    assert location2.last_tick == location.last_tick, "last_tick should match"
+    assert len(location2.personal_traces) == len(location.personal_traces), \
+        "Personal traces count should match"
+
+    # Step 9: Compute affinity after load
+    affinity_after = compute_affinity(
+        location2,
+        actor_id="actor_recent",
+        actor_tags={"human"},
+        now=now
+    )
+
+    # Affinity should be approximately the same
+    # (small differences due to floating point, but should be very close)
+    assert abs(affinity_after - affinity_before) < 0.001, \
+        f"Affinity should be preserved (before: {affinity_before}, after: {affinity_after})"
+
+
+def test_config_affects_tick_behavior(default_config):
     """
     Config settings should affect tick behavior.
 
     Verifies that prune_threshold from config is used.
     """
-    # Load config
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     # Create location with trace
     location = Location(
         location_id="test",
@@ -154,22 +149,16 @@ def test_config_affects_tick_behavior():
     report = world_tick(location, now)
 
     # Verify prune threshold from config was applied
-    assert config.compaction.prune_threshold == 0.01
+    assert default_config.compaction.prune_threshold == 0.01
     assert report.traces_pruned >= 1
 
-    # Cleanup
-    reset_config()
-
 
-def test_multiple_locations_independent():
+def test_multiple_locations_independent(tmp_path):
     """
     Multiple locations should have independent state.
 
     Verifies that saving/loading one location doesn't affect another.
     """
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     # Create two locations
     location1 = Location(
         location_id="woods_a",
@@ -206,40 +195,33 @@ def test_multiple_locations_independent():
     log_event(location2, event2)
 
     # Save both to temp directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        save_location_state(location1, data_dir=tmpdir)
-        save_location_state(location2, data_dir=tmpdir)
+    save_location_state(location1, data_dir=str(tmp_path))
+    save_location_state(location2, data_dir=str(tmp_path))
 
-        # Load into fresh locations
-        fresh1 = Location(location_id="woods_a", name="Woods A", description="First woods")
-        fresh2 = Location(location_id="woods_b", name="Woods B", description="Second woods")
+    # Load into fresh locations
+    fresh1 = Location(location_id="woods_a", name="Woods A", description="First woods")
+    fresh2 = Location(location_id="woods_b", name="Woods B", description="Second woods")
 
-        load_location_state(fresh1, data_dir=tmpdir)
-        load_location_state(fresh2, data_dir=tmpdir)
+    load_location_state(fresh1, data_dir=str(tmp_path))
+    load_location_state(fresh2, data_dir=str(tmp_path))
 
-        # Verify independence
-        assert len(fresh1.personal_traces) > 0
-        assert len(fresh2.personal_traces) > 0
+    # Verify independence
+    assert len(fresh1.personal_traces) > 0
+    assert len(fresh2.personal_traces) > 0
 
-        # Check that traces are different
-        assert ("actor_1", "harm.fire") in fresh1.personal_traces
-        assert ("actor_2", "offer.gift") in fresh2.personal_traces
-        assert ("actor_1", "harm.fire") not in fresh2.personal_traces
-        assert ("actor_2", "offer.gift") not in fresh1.personal_traces
+    # Check that traces are different
+    assert ("actor_1", "harm.fire") in fresh1.personal_traces
+    assert ("actor_2", "offer.gift") in fresh2.personal_traces
+    assert ("actor_1", "harm.fire") not in fresh2.personal_traces
+    assert ("actor_2", "offer.gift") not in fresh1.personal_traces
 
-    # Cleanup
-    reset_config()
 
-
-def test_tick_then_save_then_load():
+def test_tick_then_save_then_load(tmp_path):
     """
     Ticking should affect saved state.
 
     Verifies that tick modifications are persisted.
     """
-    config = load_config_from_yaml("config/affinity_defaults.yaml")
-    set_config(config)
-
     location = Location(
         location_id="test",
         name="Test",
@@ -259,15 +241,11 @@ def test_tick_then_save_then_load():
     assert location.saturation.personal < 0.8
 
     # Save
-    with tempfile.TemporaryDirectory() as tmpdir:
-        save_location_state(location, data_dir=tmpdir)
-
-        # Load
-        fresh = Location(location_id="test", name="Test", description="Test")
-        load_location_state(fresh, data_dir=tmpdir)
+    save_location_state(location, data_dir=str(tmp_path))
 
-        # Verify saturation was saved
-        assert fresh.saturation.personal == location.saturation.personal
+    # Load
+    fresh = Location(location_id="test", name="Test", description="Test")
+    load_location_state(fresh, data_dir=str(tmp_path))
 
-    # Cleanup
-    reset_config()
+    # Verify saturation was saved
+    assert fresh.saturation.personal == location.saturation.personal
@@ -257,6 +257,30 @@ class TestHostileOutcome:
         assert affinity < -0.3
         assert get_threshold_label(affinity) in ["hostile", "unwelcoming"]
 
+    def test_anonymous_query_skips_personal_channel(self, whispering_woods, actor_human_hunter):
+        """actor_id=None should ignore personal traces but keep group/behavior."""
+        reset_config()
+        now = time.time()
+
+        log_event(whispering_woods, AffinityEvent(
+            event_type="harm.fire",
+            actor_id=actor_human_hunter["actor_id"],
+            actor_tags=actor_human_hunter["actor_tags"],
+            location_id=whispering_woods.location_id,
+            intensity=0.6,
+            timestamp=now,
+        ))
+
+        tags = actor_human_hunter["actor_tags"]
+        named = compute_affinity(whispering_woods, actor_human_hunter["actor_id"], tags, now=now)
+        anonymous = compute_affinity(whispering_woods, None, tags, now=now)
+        stranger = compute_affinity(whispering_woods, "someone_else", tags, now=now)
+
+        # Group and behavior still push negative; personal is dropped
+        assert anonymous < 0
+        assert anonymous == stranger
+        assert named < anonymous
+
     def test_hostile_traveler_is_slowed(self, whispering_woods, actor_human_hunter):
         """A hostile forest should slow the traveler."""
         reset_config()
@@ -27,7 +27,7 @@ from world.affinity.affordances import (
     AffordanceSnapshot,
     evaluate_affordances,
 )
-from world.affinity.events import log_event
+from world.affinity.events import log_event, log_events_batch
 
 __all__ = [
     # Core data structures
@@ -51,4 +51,5 @@ __all__ = [
     "evaluate_affordances",
     # Events
     "log_event",
+    "log_events_batch",
 ]
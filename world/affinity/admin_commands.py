@@ -7,18 +7,19 @@ be called by Evennia command handlers.
 See docs/affinity_spec.md §6.4
 """
 
-from typing import Optional, List, Tuple, Set
+from typing import AbstractSet, Optional, List, Tuple
+import heapq
 import time
 
 from world.affinity.core import Location, AffordanceTriggerLog
-from world.affinity.computation import compute_affinity
+from world.affinity.computation import compute_affinity, get_decayed_value
 from world.affinity.config import get_config
 
 
 def get_top_contributing_traces(
     location: Location,
     actor_id: str,
-    actor_tags: Set[str],
+    actor_tags: AbstractSet[str],
     n: int = 5,
     now: Optional[float] = None
 ) -> List[Tuple[str, float]]:
@@ -42,8 +43,6 @@ def get_top_contributing_traces(
     traces = []
 
     # Convert half-lives to seconds
-    from world.affinity.computation import get_decayed_value
-
     personal_half_life = config.half_lives.location.personal * 86400
     group_half_life = config.half_lives.location.group * 86400
 
@@ -59,16 +58,15 @@ def get_top_contributing_traces(
             value = get_decayed_value(trace, group_half_life, now)
             traces.append((f"group:{key[0]}:{key[1]}", value))
 
-    # Sort by absolute value (most influential)
-    traces.sort(key=lambda x: abs(x[1]), reverse=True)
-
-    return traces[:n]
+    # Top n by absolute value (most influential); same order as a full
+    # stable sort, without sorting traces that are cut anyway
+    return heapq.nlargest(n, traces, key=lambda x: abs(x[1]))
 
 
 def cmd_affinity_inspect(
     location: Location,
     actor_id: str,
-    actor_tags: Set[str],
+    actor_tags: AbstractSet[str],
     now: Optional[float] = None
 ) -> str:
     """
@@ -14,7 +14,7 @@ import random
 import time
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
 
 from world.affinity.core import (
     Location,
@@ -25,6 +25,7 @@ from world.affinity.computation import (
     compute_affinity,
     get_threshold_label,
     get_decayed_value,
+    get_location_params,
     get_valuation,
     score_personal,
     score_group,
@@ -96,6 +97,11 @@ def admin_get_registry() -> Dict[str, bool]:
     return dict(_AFFORDANCE_REGISTRY)
 
 
+def admin_get_force_modes() -> Dict[str, Optional[str]]:
+    """Get current forced mode per affordance (None when not forced)."""
+    return dict(_FORCE_MODE)
+
+
 def is_affordance_enabled(affordance_type: str) -> bool:
     """Check if an affordance is globally enabled."""
     return _AFFORDANCE_REGISTRY.get(affordance_type, False)
@@ -450,7 +456,7 @@ class AffordanceContext:
     Input to affordance evaluation.
     """
     actor_id: str
-    actor_tags: Set[str]
+    actor_tags: AbstractSet[str]
     location: Location
     action_type: str
     action_target: Optional[str]
@@ -500,22 +506,22 @@ def _consume_cooldown(
 def _compute_contributing_traces(
     location: Location,
     actor_id: str,
-    actor_tags: Set[str],
+    actor_tags: AbstractSet[str],
     now: float
 ) -> List[TraceContribution]:
     """Compute which traces contributed most to the affinity."""
     contributions = []
-    config = get_config()
+    params = get_location_params()
     profile = location.valuation_profile
 
     # Personal channel
-    personal_half_life = config.half_lives.location.personal * 86400
+    personal_half_life = params.personal_half_life
     for (trace_actor_id, event_type), trace in location.personal_traces.items():
         if trace_actor_id != actor_id:
             continue
         decayed = get_decayed_value(trace, personal_half_life, now)
         valuation = get_valuation(profile, event_type)
-        weighted = decayed * valuation * config.channel_weights.personal
+        weighted = decayed * valuation * params.personal_weight
         contributions.append(TraceContribution(
             channel="personal",
             trace_key=f"({trace_actor_id}, {event_type})",
@@ -525,13 +531,13 @@ def _compute_contributing_traces(
         ))
 
     # Group channel
-    group_half_life = config.half_lives.location.group * 86400
+    group_half_life = params.group_half_life
     for (trace_tag, event_type), trace in location.group_traces.items():
         if trace_tag not in actor_tags:
             continue
         decayed = get_decayed_value(trace, group_half_life, now)
         valuation = get_valuation(profile, event_type)
-        weighted = decayed * valuation * config.channel_weights.group
+        weighted = decayed * valuation * params.group_weight
         contributions.append(TraceContribution(
             channel="group",
             trace_key=f"({trace_tag}, {event_type})",
@@ -541,11 +547,11 @@ def _compute_contributing_traces(
         ))
 
     # Behavior channel
-    behavior_half_life = config.half_lives.location.behavior * 86400
+    behavior_half_life = params.behavior_half_life
     for event_type, trace in location.behavior_traces.items():
         decayed = get_decayed_value(trace, behavior_half_life, now)
         valuation = get_valuation(profile, event_type)
-        weighted = decayed * valuation * config.channel_weights.behavior
+        weighted = decayed * valuation * params.behavior_weight
         contributions.append(TraceContribution(
             channel="behavior",
             trace_key=event_type,
@@ -1516,6 +1522,11 @@ def validate_affordance_definitions() -> None:
         ) from e
 
 
+# Handles are fixed in AFFORDANCE_DEFAULTS (only probabilities are tuned at
+# runtime), so the validated counts are computed once.
+_handle_counts: Optional[Dict[str, int]] = None
+
+
 def get_handle_counts() -> Dict[str, int]:
     """
     Get the number of mechanical handles each affordance uses.
@@ -1523,8 +1534,11 @@ def get_handle_counts() -> Dict[str, int]:
     Returns:
         Dict mapping affordance_type -> handle_count
     """
-    from world.affinity.validation import validate_all_affordances
-    return validate_all_affordances(AFFORDANCE_DEFAULTS)
+    global _handle_counts
+    if _handle_counts is None:
+        from world.affinity.validation import validate_all_affordances
+        _handle_counts = validate_all_affordances(AFFORDANCE_DEFAULTS)
+    return dict(_handle_counts)
 
 
 # Run validation on module import
@@ -11,6 +11,13 @@ from world.affinity.core import Artifact, BearerRecord, PressureRule
 from world.affinity.config import get_config
 
 
+# Carry time at which influence saturates at 1.0 (7 days)
+INFLUENCE_SATURATION_SECONDS = 7 * 86400
+
+# Influence a bearer needs before influence-scaled rules can trigger
+MIN_PRESSURE_INFLUENCE = 0.1
+
+
 def update_bearer_trace(
     artifact: Artifact,
     bearer_id: str,
@@ -33,22 +40,22 @@ def update_bearer_trace(
     if now is None:
         now = time.time()
 
-    if bearer_id not in artifact.bearer_traces:
-        artifact.bearer_traces[bearer_id] = BearerRecord(
+    record = artifact.bearer_traces.get(bearer_id)
+    if record is None:
+        record = artifact.bearer_traces[bearer_id] = BearerRecord(
             bearer_id=bearer_id,
             accumulated_time=0.0,
             last_carried=now,
             intensity=0.0,
         )
 
-    record = artifact.bearer_traces[bearer_id]
     record.accumulated_time += elapsed_seconds
     record.last_carried = now
 
     # Influence grows with time
     # Simple curve: reaches max (1.0) after 7 days
     # TODO: More sophisticated influence curve based on artifact properties
-    record.intensity = min(1.0, record.accumulated_time / (7 * 86400))
+    record.intensity = min(1.0, record.accumulated_time / INFLUENCE_SATURATION_SECONDS)
 
 
 def evaluate_pressure(
@@ -67,20 +74,20 @@ def evaluate_pressure(
         artifact: Artifact potentially exerting pressure
         bearer_id: ID of bearer
         action_context: Context about current action/state
-        now: Current timestamp
+        now: Current timestamp. Reserved for per-rule cooldowns; not read
+            yet, so the clock is not sampled.
 
     Returns:
         PressureRule if triggered, None otherwise
 
     See docs/affinity_spec.md §5.2
     """
-    if now is None:
-        now = time.time()
-
-    if bearer_id not in artifact.bearer_traces:
+    bearer_record = artifact.bearer_traces.get(bearer_id)
+    if bearer_record is None:
         return None
 
-    bearer_record = artifact.bearer_traces[bearer_id]
+    # Bearer influence is fixed for this evaluation; test it once
+    has_influence = bearer_record.intensity >= MIN_PRESSURE_INFLUENCE
 
     for rule in artifact.pressure_vectors:
         # Check cooldown
@@ -102,7 +109,7 @@ def evaluate_pressure(
             pass
 
         # Check if influence is high enough
-        if rule.scales_with_influence and bearer_record.intensity < 0.1:
+        if rule.scales_with_influence and not has_influence:
             # Not enough influence yet
             continue
 
@@ -126,18 +133,14 @@ def compute_influence(
     Args:
         artifact: Artifact exerting influence
         bearer_id: ID of bearer
-        now: Current timestamp
+        now: Current timestamp. Unused: influence is stored on the bearer
+            record, so the clock is not sampled.
 
     Returns:
         Influence level (0.0-1.0)
     """
-    if now is None:
-        now = time.time()
-
-    if bearer_id not in artifact.bearer_traces:
-        return 0.0
-
-    return artifact.bearer_traces[bearer_id].intensity
+    record = artifact.bearer_traces.get(bearer_id)
+    return record.intensity if record is not None else 0.0
 
 
 def get_bearer_history(
@@ -6,6 +6,7 @@ See docs/affinity_spec.md §4.7
 
 from typing import Dict, Tuple, Set, List, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 import time
 
 from world.affinity.core import Location, TraceRecord, ScarEvent
@@ -38,17 +39,21 @@ def fold_actor_tag(tag: str) -> Optional[str]:
     return tag if tag in config.institutional_tags else None
 
 
+@lru_cache(maxsize=512)
 def fold_event_type(event_type: str) -> str:
     """
     Extract category prefix: 'harm.fire' → 'harm'
 
+    Cached: event types come from a small vocabulary, and every fold of
+    the same type shares one category string.
+
     Args:
         event_type: Event type with optional subtype
 
     Returns:
         Category prefix only
     """
-    return event_type.split('.')[0]
+    return event_type.partition('.')[0]
 
 
 def compact_personal_traces(
@@ -64,59 +69,82 @@ def compact_personal_traces(
     Returns:
         Number of personal traces discarded
     """
-    to_remove = []
-
-    for key, trace in location.personal_traces.items():
-        age_seconds = now - trace.last_updated
-        if age_seconds > hot_window_seconds:
-            to_remove.append(key)
-
-    for key in to_remove:
-        del location.personal_traces[key]
-
-    return len(to_remove)
+    # Compare timestamps against one cutoff instead of computing each age
+    cutoff = now - hot_window_seconds
+    traces = location.personal_traces
+    # Rebuilding from survivors is cheaper than deleting many keys in place
+    survivors = {key: trace for key, trace in traces.items() if trace.last_updated >= cutoff}
+    discarded = len(traces) - len(survivors)
+
+    if discarded:
+        location.personal_traces = survivors
+
+    return discarded
+
+
+def _make_scar(actor_tag: str, event_type: str, trace: TraceRecord,
+               half_life_seconds: float) -> ScarEvent:
+    """Build the scar left by an old, high-intensity group trace."""
+    return ScarEvent(
+        event_type=fold_event_type(event_type),
+        actor_tags={actor_tag},
+        intensity=abs(trace.accumulated),
+        timestamp=trace.last_updated,
+        half_life_seconds=half_life_seconds,
+    )
 
 
-def compact_group_traces(
+def _fold_group_traces(
     location: Location,
-    hot_window_seconds: float,
-    warm_window_seconds: float,
-    now: float
-) -> int:
+    hot_cutoff: float,
+    scar_cutoff: Optional[float] = None,
+    scar_intensity_threshold: float = 0.0,
+    scar_half_life_seconds: float = 0.0,
+) -> Tuple[int, int]:
     """
-    Hot → Warm: Merge group traces older than the *warm* window.
-
-    Rationale (tests + Phase 1 behavior): group traces should remain usable for
-    at least ~90 days; compacting them after the hot window (7 days) makes recent
-    actor-tag memory disappear too quickly and breaks the vertical slice.
+    Fold group traces, optionally creating scars in the same pass.
 
-    Only institutional tags survive folding. Keys become (folded_tag, category).
-    Non-institutional tags are discarded.
+    Each trace is checked for scarring before it is folded, so the result
+    matches create_scars_from_warm followed by compact_group_traces.
+    Passing scar_cutoff=None skips scarring.
 
-    Returns number of traces processed/compacted.
+    Returns:
+        (traces compacted, scars created)
     """
     compacted_count = 0
+    scars_created = 0
+    # Same membership test as fold_actor_tag, resolved once per pass
+    institutional_tags = get_config().institutional_tags
 
     merged: Dict[Tuple[str, str], TraceRecord] = {}
 
     for key, trace in location.group_traces.items():
         actor_tag, event_type = key
-        age_seconds = now - trace.last_updated
 
-        if age_seconds <= hot_window_seconds:
+        if (
+            scar_cutoff is not None
+            and trace.last_updated < scar_cutoff
+            and abs(trace.accumulated) > scar_intensity_threshold
+            and actor_tag in institutional_tags
+        ):
+            location.scars.append(
+                _make_scar(actor_tag, event_type, trace, scar_half_life_seconds)
+            )
+            scars_created += 1
+
+        if trace.last_updated >= hot_cutoff:
             # Still hot, keep as-is
             merged[key] = trace
             continue
 
         # Older than hot window → fold
-        folded_tag = fold_actor_tag(actor_tag)
-        if not folded_tag:
+        if actor_tag not in institutional_tags:
             # Non-institutional tag, discard
             compacted_count += 1
             continue
 
         category = fold_event_type(event_type)
-        merged_key = (folded_tag, category)
+        merged_key = (actor_tag, category)
 
         if merged_key in merged:
             merged[merged_key].accumulated += trace.accumulated
@@ -133,6 +161,28 @@ def compact_group_traces(
         compacted_count += 1
 
     location.group_traces = merged
+    return compacted_count, scars_created
+
+
+def compact_group_traces(
+    location: Location,
+    hot_window_seconds: float,
+    warm_window_seconds: float,
+    now: float
+) -> int:
+    """
+    Hot → Warm: Merge group traces older than the *warm* window.
+
+    Rationale (tests + Phase 1 behavior): group traces should remain usable for
+    at least ~90 days; compacting them after the hot window (7 days) makes recent
+    actor-tag memory disappear too quickly and breaks the vertical slice.
+
+    Only institutional tags survive folding. Keys become (folded_tag, category).
+    Non-institutional tags are discarded.
+
+    Returns number of traces processed/compacted.
+    """
+    compacted_count, _ = _fold_group_traces(location, now - hot_window_seconds)
     return compacted_count
 
 
@@ -159,32 +209,23 @@ def create_scars_from_warm(
     """
     config = get_config()
     scars_created = 0
+    warm_cutoff = now - warm_window_seconds
+    institutional_tags = config.institutional_tags
+    half_life_seconds = config.compaction.scar_half_life_days * 86400
 
     # Check group traces (personal already discarded)
     for key, trace in location.group_traces.items():
-        age_seconds = now - trace.last_updated
-
-        if age_seconds > warm_window_seconds:
+        if trace.last_updated < warm_cutoff:
             # Check if this should become a scar
             # Approximate intensity from accumulated value
             # (This is heuristic; ideally we'd track original intensity)
             if abs(trace.accumulated) > scar_intensity_threshold:
-                # Create scar
                 actor_tag, event_type = key
-                folded_tag = fold_actor_tag(actor_tag)
-
-                if folded_tag:
-                    category = fold_event_type(event_type)
 
-                    scar = ScarEvent(
-                        event_type=category,
-                        actor_tags={folded_tag},
-                        intensity=abs(trace.accumulated),
-                        timestamp=trace.last_updated,
-                        half_life_seconds=config.compaction.scar_half_life_days * 86400,
+                if actor_tag in institutional_tags:
+                    location.scars.append(
+                        _make_scar(actor_tag, event_type, trace, half_life_seconds)
                     )
-
-                    location.scars.append(scar)
                     scars_created += 1
 
     return scars_created
@@ -222,20 +263,14 @@ def compact_traces(location: Location, now: Optional[float] = None) -> Compactio
     # Step 1: Discard old personal traces
     hot_to_warm = compact_personal_traces(location, hot_window_seconds, now)
 
-    # Step 2: Create scars before compacting (so we don't lose high-intensity traces)
-    warm_to_scar = create_scars_from_warm(
-        location,
-        warm_window_seconds,
-        scar_intensity_threshold,
-        now
-    )
-
-    # Step 3: Compact group traces
-    traces_compacted = compact_group_traces(
+    # Steps 2+3 in one pass over group traces: scar each high-intensity warm
+    # trace before folding it (so we don't lose high-intensity traces)
+    traces_compacted, warm_to_scar = _fold_group_traces(
         location,
-        hot_window_seconds,
-        warm_window_seconds,
-        now
+        now - hot_window_seconds,
+        scar_cutoff=now - warm_window_seconds,
+        scar_intensity_threshold=scar_intensity_threshold,
+        scar_half_life_seconds=config.compaction.scar_half_life_days * 86400,
     )
 
     return CompactionReport(
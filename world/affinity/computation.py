@@ -6,10 +6,71 @@ See docs/affinity_spec.md §4.3-4.6 for specification.
 
 import math
 import time
-from typing import Dict, Optional, Set, Tuple
+from typing import AbstractSet, Dict, NamedTuple, Optional, Tuple
 
 from world.affinity.core import TraceRecord, Location
-from world.affinity.config import get_config
+from world.affinity.config import AffinityConfig, get_config, get_config_version
+
+
+class LocationParams(NamedTuple):
+    """Location-channel settings unpacked from an AffinityConfig."""
+    personal_half_life: float  # seconds
+    group_half_life: float  # seconds
+    behavior_half_life: float  # seconds
+    personal_weight: float
+    group_weight: float
+    behavior_weight: float
+    tanh_scale: float  # multiplier applied to the raw blend before tanh
+
+
+# Last unpacked active config: (config, config version, params). One tuple,
+# so a reader never pairs one config's params with another's identity.
+_params_cache: Optional[Tuple[AffinityConfig, int, LocationParams]] = None
+
+
+def _unpack_location_params(config: AffinityConfig) -> LocationParams:
+    """Convert a config's location half-lives to seconds and pull its weights."""
+    W = config.channel_weights
+    return LocationParams(
+        personal_half_life=config.half_lives.location.personal * 86400,
+        group_half_life=config.half_lives.location.group * 86400,
+        behavior_half_life=config.half_lives.location.behavior * 86400,
+        personal_weight=W.personal,
+        group_weight=W.group,
+        behavior_weight=W.behavior,
+        tanh_scale=config.affinity_scale / 10.0,
+    )
+
+
+def get_location_params(config: Optional[AffinityConfig] = None) -> LocationParams:
+    """
+    Return location half-lives, channel weights and scale for a config.
+
+    For the active config the result is cached on the config's identity
+    and the config version, which set_config(), reset_config() and
+    use_config() bump. In-place edits to the active config are picked up
+    once it is re-installed with one of those. An explicit config is
+    always unpacked fresh.
+
+    Args:
+        config: Config to unpack. Defaults to the active config.
+
+    Returns:
+        LocationParams for the config
+    """
+    global _params_cache
+    if config is not None:
+        return _unpack_location_params(config)
+
+    config = get_config()
+    version = get_config_version()
+    cached = _params_cache
+    if cached is not None and cached[0] is config and cached[1] == version:
+        return cached[2]
+
+    params = _unpack_location_params(config)
+    _params_cache = (config, version, params)
+    return params
 
 
 def get_decayed_value(
@@ -58,16 +119,13 @@ def get_valuation(profile: Dict[str, float], event_type: str) -> float:
         Valuation weight for this event type
     """
     # Try exact match
-    if event_type in profile:
-        return profile[event_type]
-
-    # Try category match
-    category = event_type.split('.')[0]
-    if category in profile:
-        return profile[category]
+    valuation = profile.get(event_type)
+    if valuation is not None:
+        return valuation
 
-    # Default: neutral
-    return 0.0
+    # Try category match, falling back to neutral
+    category = event_type.partition('.')[0]
+    return profile.get(category, 0.0)
 
 
 def score_personal(
@@ -93,19 +151,22 @@ def score_personal(
     Returns:
         Weighted score for personal channel
     """
+    if now is None:
+        now = time.time()  # One clock read: every trace decays to the same instant
     score = 0.0
     for (trace_actor_id, event_type), trace in traces.items():
         if trace_actor_id != actor_id:
             continue
-        value = get_decayed_value(trace, half_life_seconds, now)
         valuation = get_valuation(profile, event_type)
-        score += value * valuation
+        if valuation == 0.0:
+            continue  # Neutral event types contribute nothing; skip the decay
+        score += get_decayed_value(trace, half_life_seconds, now) * valuation
     return score
 
 
 def score_group(
     traces: Dict[Tuple[str, str], TraceRecord],
-    actor_tags: Set[str],
+    actor_tags: AbstractSet[str],
     half_life_seconds: float,
     profile: Dict[str, float],
     now: Optional[float] = None
@@ -126,13 +187,16 @@ def score_group(
     Returns:
         Weighted score for group channel
     """
+    if now is None:
+        now = time.time()
     score = 0.0
     for (trace_tag, event_type), trace in traces.items():
         if trace_tag not in actor_tags:
             continue
-        value = get_decayed_value(trace, half_life_seconds, now)
         valuation = get_valuation(profile, event_type)
-        score += value * valuation
+        if valuation == 0.0:
+            continue
+        score += get_decayed_value(trace, half_life_seconds, now) * valuation
     return score
 
 
@@ -157,18 +221,21 @@ def score_behavior(
     Returns:
         Weighted score for behavior channel
     """
+    if now is None:
+        now = time.time()
     score = 0.0
     for event_type, trace in traces.items():
-        value = get_decayed_value(trace, half_life_seconds, now)
         valuation = get_valuation(profile, event_type)
-        score += value * valuation
+        if valuation == 0.0:
+            continue
+        score += get_decayed_value(trace, half_life_seconds, now) * valuation
     return score
 
 
 def compute_affinity(
     location: Location,
-    actor_id: str,
-    actor_tags: Set[str],
+    actor_id: Optional[str],
+    actor_tags: AbstractSet[str],
     now: Optional[float] = None
 ) -> float:
     """
@@ -182,53 +249,59 @@ def compute_affinity(
 
     Args:
         location: The location to compute affinity for
-        actor_id: The actor's unique ID
+        actor_id: The actor's unique ID, or None for an anonymous query
+            (group and behavior channels only; personal contributes 0)
         actor_tags: The actor's categorical tags
         now: Evaluation time for deterministic replay
 
     Returns:
         Affinity value in range [-1.0, 1.0]
     """
-    config = get_config()
+    params = get_location_params()
     profile = location.valuation_profile
+    if now is None:
+        now = time.time()  # All three channels decay to the same instant
 
-    # Convert half-lives from days to seconds
-    personal_half_life = config.half_lives.location.personal * 86400
-    group_half_life = config.half_lives.location.group * 86400
-    behavior_half_life = config.half_lives.location.behavior * 86400
-
-    personal = score_personal(
-        location.personal_traces,
-        actor_id,
-        personal_half_life,
-        profile,
-        now
-    )
+    # Personal keys always carry a real actor id; anonymous queries
+    # (e.g. institutions polling constituents) can skip the scan
+    if actor_id is None:
+        personal = 0.0
+    else:
+        personal = score_personal(
+            location.personal_traces,
+            actor_id,
+            params.personal_half_life,
+            profile,
+            now
+        )
 
     group = score_group(
         location.group_traces,
         actor_tags,
-        group_half_life,
+        params.group_half_life,
         profile,
         now
     )
 
     behavior = score_behavior(
         location.behavior_traces,
-        behavior_half_life,
+        params.behavior_half_life,
         profile,
         now
     )
 
     # Blend channels with configured weights
-    W = config.channel_weights
-    raw = W.personal * personal + W.group * group + W.behavior * behavior
+    raw = (
+        params.personal_weight * personal
+        + params.group_weight * group
+        + params.behavior_weight * behavior
+    )
 
     # Normalize to [-1, 1] using tanh.
     # The spec uses tanh compression; tests assume affinity_scale is the *divisor*.
     # We use the reciprocal here so that the default YAML value (10.0) still yields
     # sufficiently strong responses for the vertical slice.
-    return math.tanh(raw * (config.affinity_scale / 10.0))
+    return math.tanh(raw * params.tanh_scale)
 
 
 def get_threshold_label(affinity: float) -> str:
@@ -7,9 +7,16 @@ See docs/affinity_spec.md §7 for specification.
 
 import os
 import yaml
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Set
+from typing import Any, Iterator, Optional, Set
+
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass
@@ -112,25 +119,91 @@ _DEFAULT_CONFIG = AffinityConfig(
     affinity_scale=10.0,
 )
 
-# Active configuration (can be replaced at runtime)
+# Active configuration (can be replaced at runtime). Process-wide, so every
+# thread sees the config installed at startup.
 _active_config: AffinityConfig = _DEFAULT_CONFIG
 
+# Per-context override installed by use_config(). New threads start with an
+# empty context and fall back to _active_config; asyncio tasks inherit a copy.
+_scoped_config: ContextVar[Optional[AffinityConfig]] = ContextVar(
+    "affinity_scoped_config", default=None
+)
+
+# Bumped every time a config is installed or restored. Derived caches key on
+# (config identity, version), so re-installing an edited config refreshes them.
+_config_version: int = 0
+
+
+def get_config_version() -> int:
+    """Return a counter that changes whenever the active config is (re)installed."""
+    return _config_version
+
 
 def get_config() -> AffinityConfig:
     """Get the active affinity configuration."""
-    return _active_config
+    scoped = _scoped_config.get()
+    return _active_config if scoped is None else scoped
 
 
 def set_config(config: AffinityConfig) -> None:
-    """Set the active affinity configuration."""
-    global _active_config
+    """
+    Set the process-wide affinity configuration.
+
+    Inside a use_config() block the block's config still takes precedence.
+    Call again after editing the active config in place, so cached derived
+    values (see computation.get_location_params) are refreshed.
+    """
+    global _active_config, _config_version
     _active_config = config
+    _config_version += 1
 
 
 def reset_config() -> None:
-    """Reset to default configuration."""
-    global _active_config
+    """Reset the process-wide configuration to the default."""
+    global _active_config, _config_version
     _active_config = _DEFAULT_CONFIG
+    _config_version += 1
+
+
+@contextmanager
+def use_config(config: AffinityConfig) -> Iterator[AffinityConfig]:
+    """
+    Activate a configuration for the duration of a with-block.
+
+    The override lives in a ContextVar, so it is visible only to the
+    current thread or asyncio task; blocks nest and are restored in
+    order even on error. Other threads keep seeing the process-wide
+    config from set_config().
+
+    Args:
+        config: Configuration to activate
+
+    Yields:
+        The activated configuration
+    """
+    global _config_version
+    token = _scoped_config.set(config)
+    _config_version += 1
+    try:
+        yield config
+    finally:
+        _scoped_config.reset(token)
+        _config_version += 1
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(resolved_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, cached on its resolved path, mtime and size.
+
+    The file's stat fields are part of the key so an edited file is
+    re-read. Callers must treat the returned data as read-only.
+    """
+    with open(resolved_path, 'r') as f:
+        try:
+            return yaml.load(f, Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse YAML: {e}")
 
 
 def load_config_from_yaml(yaml_path: str) -> AffinityConfig:
@@ -141,7 +214,10 @@ def load_config_from_yaml(yaml_path: str) -> AffinityConfig:
         yaml_path: Path to affinity_defaults.yaml
 
     Returns:
-        Fully validated AffinityConfig instance
+        Fully validated AffinityConfig instance. Parsed YAML is cached
+        per file, but every call builds a new config, so callers may
+        mutate the result. Edit it before activating it, or re-activate
+        it with set_config()/use_config() after editing.
 
     Raises:
         FileNotFoundError: If YAML file doesn't exist
@@ -155,11 +231,8 @@ def load_config_from_yaml(yaml_path: str) -> AffinityConfig:
     if not yaml_file.exists():
         raise FileNotFoundError(f"Config file not found: {yaml_path}")
 
-    with open(yaml_file, 'r') as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML: {e}")
+    stat = yaml_file.stat()
+    data = _parse_yaml(str(yaml_file.resolve()), stat.st_mtime_ns, stat.st_size)
 
     if not isinstance(data, dict):
         raise ValueError("YAML root must be a dictionary")
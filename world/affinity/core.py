@@ -6,16 +6,19 @@ See docs/contract_examples.md for JSON shapes.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Set, Tuple, Optional, List
+from typing import AbstractSet, Dict, Set, Tuple, Optional, List
 import time
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceRecord:
     """
     A single correlation stored in an entity's memory.
     The dict key carries identity; this stores only accumulated state.
 
+    Slotted to keep large trace tables compact; not frozen, since
+    log_event updates records in place.
+
     See spec §4.1
     """
     accumulated: float
@@ -37,7 +40,7 @@ class SaturationState:
     behavior: float = 0.0  # 0.0–1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScarEvent:
     """
     High-intensity event preserved as long-term landmark.
@@ -48,7 +51,7 @@ class ScarEvent:
     See spec §4.7
     """
     event_type: str                # Category only (e.g., "harm" not "harm.fire")
-    actor_tags: Set[str]           # Institutional tags only
+    actor_tags: AbstractSet[str]   # Institutional tags only
     intensity: float               # Original intensity (>0.7)
     timestamp: float               # When it happened
     half_life_seconds: float       # 365 days * 86400 = 31536000
@@ -63,7 +66,7 @@ class AffinityEvent:
     """
     event_type: str                    # From controlled vocabulary (e.g., "harm.fire")
     actor_id: str                      # Who initiated
-    actor_tags: Set[str]               # Categorical markers at time of event
+    actor_tags: AbstractSet[str]       # Categorical markers at time of event (set or frozenset)
     location_id: str                   # Where it happened
     intensity: float                   # 0.0–1.0, magnitude of action
     timestamp: float = field(default_factory=time.time)
@@ -136,7 +139,7 @@ class MoodBand:
     last_updated: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BearerRecord:
     """
     Record of time spent carrying an artifact.
@@ -149,7 +152,7 @@ class BearerRecord:
     intensity: float         # how much it has influenced this bearer
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PressureRule:
     """
     How an artifact influences its bearer.
@@ -230,7 +233,7 @@ class AffordanceTriggerLog:
     location_id: str
     affordance_type: str
     actor_id: str
-    actor_tags: Set[str]
+    actor_tags: AbstractSet[str]
     timestamp: float
 
     # Computed values
@@ -5,9 +5,10 @@ See docs/affinity_spec.md §3 for event ontology.
 """
 
 import time
+from typing import Iterable, Tuple
+
 from world.affinity.core import AffinityEvent, Location, TraceRecord, SaturationState
-from world.affinity.config import get_config
-from world.affinity.computation import get_decayed_value
+from world.affinity.computation import get_decayed_value, get_location_params
 
 
 def _get_saturation_for_channel(saturation: SaturationState, channel: str) -> float:
@@ -61,86 +62,131 @@ def _create_trace(intensity: float, timestamp: float) -> TraceRecord:
     )
 
 
-def log_event(location: Location, event: AffinityEvent) -> None:
-    """
-    Log an affinity event to a location's memory.
-
-    Updates all three channels:
-    - Personal: (actor_id, event_type)
-    - Group: (actor_tag, event_type) for each tag
-    - Behavior: event_type
+def _get_location_half_lives() -> Tuple[float, float, float]:
+    """Return (personal, group, behavior) location half-lives in seconds."""
+    params = get_location_params()
+    return (
+        params.personal_half_life,
+        params.group_half_life,
+        params.behavior_half_life,
+    )
 
-    See spec §4.4
 
-    Args:
-        location: The location to update
-        event: The affinity event to log
-    """
-    config = get_config()
+def _log_event(
+    location: Location,
+    event: AffinityEvent,
+    personal_half_life: float,
+    group_half_life: float,
+    behavior_half_life: float
+) -> None:
+    """Apply one event to all three channels using precomputed half-lives."""
     timestamp = event.timestamp
-
-    # Convert half-lives from days to seconds
-    personal_half_life = config.half_lives.location.personal * 86400
-    group_half_life = config.half_lives.location.group * 86400
-    behavior_half_life = config.half_lives.location.behavior * 86400
+    event_type = event.event_type
+    saturation = location.saturation
 
     # --- Personal Channel ---
-    personal_key = (event.actor_id, event.event_type)
+    personal_traces = location.personal_traces
+    personal_key = (event.actor_id, event_type)
     personal_intensity = _apply_saturation(
         event.intensity,
-        location.saturation.personal
+        saturation.personal
     )
 
-    if personal_key in location.personal_traces:
+    trace = personal_traces.get(personal_key)
+    if trace is not None:
         _update_trace(
-            location.personal_traces[personal_key],
+            trace,
             personal_intensity,
             timestamp,
             personal_half_life
         )
     else:
-        location.personal_traces[personal_key] = _create_trace(
+        personal_traces[personal_key] = _create_trace(
             personal_intensity,
             timestamp
         )
 
     # --- Group Channel ---
+    group_traces = location.group_traces
     group_intensity = _apply_saturation(
         event.intensity,
-        location.saturation.group
+        saturation.group
     )
 
     for tag in event.actor_tags:
-        group_key = (tag, event.event_type)
-        if group_key in location.group_traces:
+        group_key = (tag, event_type)
+        trace = group_traces.get(group_key)
+        if trace is not None:
             _update_trace(
-                location.group_traces[group_key],
+                trace,
                 group_intensity,
                 timestamp,
                 group_half_life
             )
         else:
-            location.group_traces[group_key] = _create_trace(
+            group_traces[group_key] = _create_trace(
                 group_intensity,
                 timestamp
             )
 
     # --- Behavior Channel ---
-    behavior_key = event.event_type
+    behavior_traces = location.behavior_traces
     behavior_intensity = _apply_saturation(
         event.intensity,
-        location.saturation.behavior
+        saturation.behavior
     )
 
-    if behavior_key in location.behavior_traces:
+    trace = behavior_traces.get(event_type)
+    if trace is not None:
         _update_trace(
-            location.behavior_traces[behavior_key],
+            trace,
             behavior_intensity,
             timestamp,
             behavior_half_life
         )
     else:
-        location.behavior_traces[behavior_key] = _create_trace(
+        behavior_traces[event_type] = _create_trace(
             behavior_intensity,
             timestamp
         )
+
+
+def log_event(location: Location, event: AffinityEvent) -> None:
+    """
+    Log an affinity event to a location's memory.
+
+    Updates all three channels:
+    - Personal: (actor_id, event_type)
+    - Group: (actor_tag, event_type) for each tag
+    - Behavior: event_type
+
+    See spec §4.4
+
+    Args:
+        location: The location to update
+        event: The affinity event to log
+    """
+    _log_event(location, event, *_get_location_half_lives())
+
+
+def log_events_batch(location: Location, events: Iterable[AffinityEvent]) -> int:
+    """
+    Log a batch of affinity events to a location's memory, in order.
+
+    Equivalent to calling log_event() for each event, but resolves the
+    active config and half-lives once for the whole batch. Intended for
+    callers that queue events during a tick and flush them at the end.
+
+    Args:
+        location: The location to update
+        events: Events to log, applied in iteration order
+
+    Returns:
+        Number of events logged
+    """
+    half_lives = _get_location_half_lives()
+    count = 0
+    for event in events:
+        _log_event(location, event, *half_lives)
+        count += 1
+    return count
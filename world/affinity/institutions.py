@@ -34,6 +34,9 @@ def query_constituent_affinity(
 
     See docs/affinity_spec.md §2.4
     """
+    # Same tag set for every constituent; build it once
+    actor_tags = frozenset((target_tag,))
+
     total_affinity = 0.0
     count = 0
 
@@ -42,15 +45,12 @@ def query_constituent_affinity(
         # (In a full implementation, would check location tags)
         # For now, assume all provided locations are affiliated
 
-        # Compute affinity for this target tag
-        affinity = compute_affinity(
+        total_affinity += compute_affinity(
             location,
             actor_id=None,  # No specific actor
-            actor_tags={target_tag},
+            actor_tags=actor_tags,
             now=now
         )
-
-        total_affinity += affinity
         count += 1
 
     if count == 0:
@@ -79,6 +79,10 @@ def update_institution(
 
     See docs/affinity_spec.md §2.4
     """
+    stances = institution.cached_stance
+    inertia = institution.inertia
+    drift_rate = institution.drift_rate
+
     for target_tag in target_tags:
         # Query current constituent affinity
         fresh_affinity = query_constituent_affinity(
@@ -89,17 +93,12 @@ def update_institution(
         )
 
         # Get cached value
-        cached = institution.cached_stance.get(target_tag, 0.0)
+        cached = stances.get(target_tag, 0.0)
 
         # Drift toward fresh value
         # Formula: new = inertia * old + drift_rate * fresh
         # With default values (0.9, 0.1): heavily weighted toward old value
-        new_stance = (
-            institution.inertia * cached +
-            institution.drift_rate * fresh_affinity
-        )
-
-        institution.cached_stance[target_tag] = new_stance
+        stances[target_tag] = inertia * cached + drift_rate * fresh_affinity
 
     institution.last_computed = now
 
@@ -182,8 +181,13 @@ def compute_institutional_memory_decay(
         institution: Institution to decay
         elapsed_days: Time elapsed in days
     """
-    # Decay factor: 0.5 ^ (elapsed / half_life)
+    stances = institution.cached_stance
+    if not stances or elapsed_days == 0:
+        return
+
+    # Decay factor: 0.5 ^ (elapsed / half_life), computed once for all tags
     decay_factor = 0.5 ** (elapsed_days / institution.half_life_days)
 
-    for tag in institution.cached_stance:
-        institution.cached_stance[tag] *= decay_factor
+    # Overwriting existing keys while iterating items() is safe (no resize)
+    for tag, stance in stances.items():
+        stances[tag] = stance * decay_factor
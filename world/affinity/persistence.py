@@ -50,8 +50,8 @@ def _encode_traces_with_tuple_keys(
     Convert (actor_id, event_type) to "actor_id::event_type".
     """
     return {
-        f"{key[0]}::{key[1]}": _encode_trace_record(trace)
-        for key, trace in traces.items()
+        f"{actor_id}::{event_type}": _encode_trace_record(trace)
+        for (actor_id, event_type), trace in traces.items()
     }
 
 
@@ -65,11 +65,11 @@ def _decode_traces_with_tuple_keys(
     """
     result = {}
     for key_str, trace_data in data.items():
-        parts = key_str.split("::", 1)  # maxsplit=1 in case event_type has ::
-        if len(parts) != 2:
+        # Split on the first :: only, in case event_type has ::
+        actor_id, sep, event_type = key_str.partition("::")
+        if not sep:
             raise ValueError(f"Invalid trace key format: {key_str}")
-        key = (parts[0], parts[1])
-        result[key] = _decode_trace_record(trace_data)
+        result[(actor_id, event_type)] = _decode_trace_record(trace_data)
     return result
 
 
@@ -231,12 +231,15 @@ def save_location_state(location: Location, data_dir: str = "data/affinity/locat
     state_file = data_path / f"{location.location_id}.json"
     state_data = serialize_location_state(location)
 
-    # Write atomically (write to temp, then rename)
-    temp_file = state_file.with_suffix(".json.tmp")
-    with open(temp_file, 'w') as f:
-        json.dump(state_data, f, indent=2)
+    # Compact separators: state files are machine-read, and pretty-printing
+    # roughly doubles both serialization time and file size
+    payload = json.dumps(state_data, separators=(",", ":"))
 
-    temp_file.rename(state_file)
+    # Write atomically (write to temp, then replace). Path.replace is
+    # os.replace: a single rename that also overwrites on Windows.
+    temp_file = state_file.with_suffix(".json.tmp")
+    temp_file.write_text(payload)
+    temp_file.replace(state_file)
 
 
 def load_location_state(
@@ -10,7 +10,7 @@ See docs/DO_NOT.md #3, #4
 """
 
 import re
-from typing import Dict, List, Optional, Pattern, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
 
 # =============================================================================
 # HANDLE ALLOWLIST
@@ -22,8 +22,10 @@ from typing import Dict, List, Optional, Pattern, Set, Tuple
 #
 # If you need a new handle, it must already exist in the game engine.
 # Add it here ONLY after confirming the game supports it.
+#
+# Frozen so the allowlist can't be extended at runtime, only in this file.
 
-HANDLE_ALLOWLIST: Set[str] = {
+HANDLE_ALLOWLIST: FrozenSet[str] = frozenset({
     # Room/Location modifiers
     "room.travel_time_modifier",
     "room.encounter_rate_modifier",
@@ -56,7 +58,7 @@ HANDLE_ALLOWLIST: Set[str] = {
 
     # Action modifiers
     "action.skill_modifier",
-}
+})
 
 
 # =============================================================================
@@ -235,6 +237,18 @@ METER_PATTERNS: List[re.Pattern] = [
     re.compile(r'\blevel\s+\d+\b', re.IGNORECASE),  # level 5 (explicit)
 ]
 
+# Combined forms of the above, built once so validate_tell runs one search per
+# check. The case-sensitive meter patterns contain no letters, so matching the
+# union case-insensitively changes nothing.
+_FORBIDDEN_WORDS_RE: Pattern = re.compile(
+    "|".join(re.escape(word) for word in sorted(FORBIDDEN_TELL_WORDS)),
+    re.IGNORECASE,
+)
+_METER_RE: Pattern = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in METER_PATTERNS),
+    re.IGNORECASE,
+)
+
 
 def validate_tell(tell: str, affordance_type: str, tell_group: str) -> None:
     """
@@ -256,22 +270,34 @@ def validate_tell(tell: str, affordance_type: str, tell_group: str) -> None:
     Raises:
         AffordanceValidationError: If tell contains forbidden pattern
     """
-    tell_lower = tell.lower()
-
     # Check forbidden words
-    for word in FORBIDDEN_TELL_WORDS:
-        if word in tell_lower:
-            raise AffordanceValidationError(
-                f"Tell in {affordance_type}.{tell_group} contains forbidden word "
-                f"'{word}': '{tell}'"
-            )
+    match = _FORBIDDEN_WORDS_RE.search(tell)
+    if match:
+        raise AffordanceValidationError(
+            f"Tell in {affordance_type}.{tell_group} contains forbidden word "
+            f"'{match.group().lower()}': '{tell}'"
+        )
 
     # Check meter-like numeric patterns
-    for pattern in METER_PATTERNS:
-        if pattern.search(tell):
-            raise AffordanceValidationError(
-                f"Tell in {affordance_type}.{tell_group} contains meter-like pattern: '{tell}'"
-            )
+    if _METER_RE.search(tell):
+        raise AffordanceValidationError(
+            f"Tell in {affordance_type}.{tell_group} contains meter-like pattern: '{tell}'"
+        )
+
+
+def _flatten_tells(tells_dict: Dict[str, Dict]) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Flatten a TELLS-shaped dict into (affordance_type, group, tell) triples.
+
+    Non-list groups are skipped, matching validate_all_tells.
+    """
+    return tuple(
+        (aff_type, group_name, tell)
+        for aff_type, groups in tells_dict.items()
+        for group_name, tells in groups.items()
+        if isinstance(tells, list)
+        for tell in tells
+    )
 
 
 def validate_all_tells(tells_dict: Dict[str, Dict]) -> int:
@@ -287,18 +313,14 @@ def validate_all_tells(tells_dict: Dict[str, Dict]) -> int:
     Raises:
         AffordanceValidationError: If any tell fails validation
     """
-    count = 0
+    flat = _flatten_tells(tells_dict)
     errors = []
 
-    for aff_type, groups in tells_dict.items():
-        for group_name, tells in groups.items():
-            if isinstance(tells, list):
-                for tell in tells:
-                    try:
-                        validate_tell(tell, aff_type, group_name)
-                        count += 1
-                    except AffordanceValidationError as e:
-                        errors.append(str(e))
+    for aff_type, group_name, tell in flat:
+        try:
+            validate_tell(tell, aff_type, group_name)
+        except AffordanceValidationError as e:
+            errors.append(str(e))
 
     if errors:
         raise AffordanceValidationError(
@@ -306,7 +328,7 @@ def validate_all_tells(tells_dict: Dict[str, Dict]) -> int:
             "\n".join(f"  - {e}" for e in errors)
         )
 
-    return count
+    return len(flat)
 
 
 # =============================================================================
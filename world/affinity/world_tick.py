@@ -152,6 +152,8 @@ def decay_saturation(location: Location, elapsed_days: float) -> bool:
     DECAY_RATE = 0.05  # 5% per day
     FLOOR = 0.0
 
+    # Same factor for every channel; compute the power once per tick
+    decay_factor = (1 - DECAY_RATE) ** elapsed_days
     changed = False
 
     # Decay each channel independently
@@ -159,7 +161,7 @@ def decay_saturation(location: Location, elapsed_days: float) -> bool:
         old = location.saturation.personal
         location.saturation.personal = max(
             FLOOR,
-            old * (1 - DECAY_RATE) ** elapsed_days
+            old * decay_factor
         )
         changed = changed or (location.saturation.personal != old)
 
@@ -167,7 +169,7 @@ def decay_saturation(location: Location, elapsed_days: float) -> bool:
         old = location.saturation.group
         location.saturation.group = max(
             FLOOR,
-            old * (1 - DECAY_RATE) ** elapsed_days
+            old * decay_factor
         )
         changed = changed or (location.saturation.group != old)
 
@@ -175,7 +177,7 @@ def decay_saturation(location: Location, elapsed_days: float) -> bool:
         old = location.saturation.behavior
         location.saturation.behavior = max(
             FLOOR,
-            old * (1 - DECAY_RATE) ** elapsed_days
+            old * decay_factor
         )
         changed = changed or (location.saturation.behavior != old)
 